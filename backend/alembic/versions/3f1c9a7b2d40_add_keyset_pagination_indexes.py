@@ -0,0 +1,39 @@
+"""Add keyset pagination indexes
+
+Revision ID: 3f1c9a7b2d40
+Revises: 56571d82b675
+Create Date: 2026-10-18 09:12:04.118203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7b2d40'
+down_revision: Union[str, None] = '56571d82b675'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built concurrently so large item tables stay writable during the upgrade
+    with op.get_context().autocommit_block():
+        op.create_index('ix_item_created_at_id', 'item', ['created_at', 'id'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index('ix_item_owner_id_created_at_id', 'item',
+                        ['owner_id', 'created_at', 'id'],
+                        unique=False, postgresql_concurrently=True)
+        op.create_index('ix_user_created_at_id', 'user', ['created_at', 'id'],
+                        unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_created_at_id', table_name='user',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_item_owner_id_created_at_id', table_name='item',
+                      postgresql_concurrently=True)
+        op.drop_index('ix_item_created_at_id', table_name='item',
+                      postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""Add item full-text search vector
+
+Revision ID: 8b2e4d6f1a93
+Revises: 3f1c9a7b2d40
+Create Date: 2026-10-18 10:03:41.552917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d6f1a93'
+down_revision: Union[str, None] = '3f1c9a7b2d40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the item table once
+    op.add_column('item', sa.Column(
+        'search_vector', postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True))
+    with op.get_context().autocommit_block():
+        op.create_index('ix_item_search_vector', 'item', ['search_vector'],
+                        unique=False, postgresql_using='gin',
+                        postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_item_search_vector', table_name='item',
+                      postgresql_concurrently=True)
+    op.drop_column('item', 'search_vector')
@@ -0,0 +1,46 @@
+"""Send item change notifications only from sessions that enable them
+
+Revision ID: a7d3c5e9f214
+Revises: e5b8a1d4c2f7
+Create Date: 2026-10-18 17:20:45.301776
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3c5e9f214'
+down_revision: Union[str, None] = 'e5b8a1d4c2f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# A transaction that called pg_notify takes a cluster-wide lock on the
+# notification queue at commit, serializing every notifying commit. The
+# triggers now fire only for sessions with app.item_events = 'on', which the
+# API sets on its connections when ITEM_EVENTS_ENABLED is true; other writers
+# (scripts, psql) opt in with SET app.item_events = 'on'.
+ENABLED = "current_setting('app.item_events', true) = 'on'"
+
+TRIGGERS = {
+    'item_events_insert': "AFTER INSERT ON item REFERENCING NEW TABLE AS new_rows",
+    'item_events_update': (
+        "AFTER UPDATE ON item REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    'item_events_delete': "AFTER DELETE ON item REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def _create_triggers(condition: str) -> None:
+    for name, definition in TRIGGERS.items():
+        op.execute(f"DROP TRIGGER {name} ON item")
+        op.execute(f"CREATE TRIGGER {name} {definition} FOR EACH STATEMENT "
+                   f"{condition}EXECUTE FUNCTION item_events_notify()")
+
+
+def upgrade() -> None:
+    _create_triggers(f"WHEN ({ENABLED}) ")
+
+
+def downgrade() -> None:
+    _create_triggers("")
@@ -0,0 +1,135 @@
+"""Add trigger-maintained item_stats summary table
+
+Revision ID: c4d7e1f05a62
+Revises: 8b2e4d6f1a93
+Create Date: 2026-10-18 11:26:09.301447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d7e1f05a62'
+down_revision: Union[str, None] = '8b2e4d6f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRICE_BUCKET = "width_bucket(price, ARRAY[0, 10, 50, 100, 500, 1000]::float8[])"
+
+# Aggregate signed rows (+1 added, -1 removed) into per-key deltas and fold
+# them into item_stats. Keys are upserted in a fixed order so concurrent
+# writers lock stats rows in the same order and cannot deadlock; keys whose
+# delta is zero (e.g. a title-only UPDATE) are skipped entirely.
+APPLY_DELTA = """
+INSERT INTO item_stats AS s (category, status, price_bucket, item_count,
+                             available_count, available_quantity, price_sum)
+SELECT * FROM (
+    SELECT category, status, {bucket} AS price_bucket,
+           sum(sign) AS item_count,
+           coalesce(sum(sign) FILTER (WHERE is_available), 0) AS available_count,
+           coalesce(sum(sign * quantity) FILTER (WHERE is_available), 0)
+               AS available_quantity,
+           sum(sign * price::numeric) AS price_sum
+    FROM ({rows}) AS changed
+    GROUP BY 1, 2, 3
+) AS delta
+WHERE (item_count, available_count, available_quantity, price_sum) <> (0, 0, 0, 0)
+ORDER BY category, status, price_bucket
+ON CONFLICT (category, status, price_bucket) DO UPDATE SET
+    item_count = s.item_count + EXCLUDED.item_count,
+    available_count = s.available_count + EXCLUDED.available_count,
+    available_quantity = s.available_quantity + EXCLUDED.available_quantity,
+    price_sum = s.price_sum + EXCLUDED.price_sum;
+"""
+
+ADDED = (
+    "SELECT category, status, price, quantity, is_available, 1 AS sign FROM new_rows")
+REMOVED = (
+    "SELECT category, status, price, quantity, is_available, -1 AS sign FROM old_rows")
+
+ON_INSERT = APPLY_DELTA.format(bucket=PRICE_BUCKET, rows=ADDED)
+ON_DELETE = APPLY_DELTA.format(bucket=PRICE_BUCKET, rows=REMOVED)
+ON_UPDATE = APPLY_DELTA.format(bucket=PRICE_BUCKET, rows=f"{ADDED} UNION ALL {REMOVED}")
+
+FUNCTION = f"""
+CREATE FUNCTION item_stats_apply() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {ON_INSERT}
+    ELSIF TG_OP = 'DELETE' THEN
+        {ON_DELETE}
+    ELSE
+        {ON_UPDATE}
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+TRUNCATE_FUNCTION = """
+CREATE FUNCTION item_stats_truncate() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM item_stats;
+    RETURN NULL;
+END
+$$
+"""
+
+# Statement-level triggers see every affected row at once through transition
+# tables, so a 1M-row import costs one grouped upsert rather than 1M.
+TRIGGERS = {
+    'item_stats_insert': "AFTER INSERT ON item REFERENCING NEW TABLE AS new_rows",
+    'item_stats_update': (
+        "AFTER UPDATE ON item REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    'item_stats_delete': "AFTER DELETE ON item REFERENCING OLD TABLE AS old_rows",
+}
+
+POPULATE = f"""
+INSERT INTO item_stats (category, status, price_bucket, item_count,
+                        available_count, available_quantity, price_sum)
+SELECT category, status, {PRICE_BUCKET}, count(*),
+       count(*) FILTER (WHERE is_available),
+       coalesce(sum(quantity) FILTER (WHERE is_available), 0),
+       coalesce(sum(price::numeric), 0)
+FROM item
+GROUP BY 1, 2, 3
+"""
+
+
+def upgrade() -> None:
+    category = postgresql.ENUM(name='itemcategory', create_type=False)
+    status = postgresql.ENUM(name='itemstatus', create_type=False)
+    op.create_table(
+        'item_stats',
+        sa.Column('category', category, nullable=False),
+        sa.Column('status', status, nullable=False),
+        sa.Column('price_bucket', sa.Integer(), nullable=False),
+        sa.Column('item_count', sa.BigInteger(), nullable=False),
+        sa.Column('available_count', sa.BigInteger(), nullable=False),
+        sa.Column('available_quantity', sa.BigInteger(), nullable=False),
+        sa.Column('price_sum', sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint('category', 'status', 'price_bucket'),
+    )
+    op.execute(FUNCTION)
+    op.execute(TRUNCATE_FUNCTION)
+
+    # Block writers until the triggers exist and the totals are seeded
+    op.execute("LOCK TABLE item IN SHARE MODE")
+    for name, definition in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {definition} "
+                   "FOR EACH STATEMENT EXECUTE FUNCTION item_stats_apply()")
+    op.execute("CREATE TRIGGER item_stats_truncate AFTER TRUNCATE ON item "
+               "FOR EACH STATEMENT EXECUTE FUNCTION item_stats_truncate()")
+    op.execute(POPULATE)
+
+
+def downgrade() -> None:
+    for name in [*TRIGGERS, 'item_stats_truncate']:
+        op.execute(f"DROP TRIGGER {name} ON item")
+    op.execute("DROP FUNCTION item_stats_truncate()")
+    op.execute("DROP FUNCTION item_stats_apply()")
+    op.drop_table('item_stats')
@@ -0,0 +1,37 @@
+"""Cascade item deletes from their owner
+
+Revision ID: d2a9f6c3e871
+Revises: c4d7e1f05a62
+Create Date: 2026-10-18 14:02:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a9f6c3e871'
+down_revision: Union[str, None] = 'c4d7e1f05a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_owner_fk(on_delete: str) -> None:
+    # Swap the constraint as NOT VALID so the exclusive lock is held only
+    # briefly, then validate in its own transaction: the scan of item runs
+    # under a lock that still allows writes.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE item DROP CONSTRAINT item_owner_id_fkey, "
+            "ADD CONSTRAINT item_owner_id_fkey FOREIGN KEY (owner_id) "
+            f'REFERENCES "user" (id) {on_delete} NOT VALID')
+        op.execute("ALTER TABLE item VALIDATE CONSTRAINT item_owner_id_fkey")
+
+
+def upgrade() -> None:
+    _replace_owner_fk("ON DELETE CASCADE")
+
+
+def downgrade() -> None:
+    _replace_owner_fk("")
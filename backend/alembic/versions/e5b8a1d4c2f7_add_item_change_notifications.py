@@ -0,0 +1,91 @@
+"""Publish item changes with NOTIFY for the live change feed
+
+Revision ID: e5b8a1d4c2f7
+Revises: d2a9f6c3e871
+Create Date: 2026-10-18 15:41:12.582930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8a1d4c2f7'
+down_revision: Union[str, None] = 'd2a9f6c3e871'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Statements changing more rows than this (imports, cascades of big owners)
+# send one "resync" notification instead of one per row.
+MAX_ROW_EVENTS = 1000
+
+# Events carry the ids and filterable fields only, which keeps payloads far
+# below the 8000 byte NOTIFY limit; clients fetch details via /items/batch.
+# The sequence gives every event a cluster-wide id for Last-Event-ID.
+FUNCTION = f"""
+CREATE FUNCTION item_events_notify() RETURNS trigger LANGUAGE plpgsql AS $$
+DECLARE
+    changed bigint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        SELECT count(*) INTO changed FROM new_rows;
+    ELSE
+        SELECT count(*) INTO changed FROM old_rows;
+    END IF;
+
+    IF changed = 0 THEN
+        RETURN NULL;
+    ELSIF changed > {MAX_ROW_EVENTS} THEN
+        PERFORM pg_notify('item_events', json_build_object(
+            'event_id', nextval('item_event_id_seq'), 'op', 'resync',
+            'count', changed)::text);
+    ELSIF TG_OP = 'INSERT' THEN
+        PERFORM pg_notify('item_events', json_build_object(
+            'event_id', nextval('item_event_id_seq'), 'op', 'created',
+            'id', id, 'owner_id', owner_id, 'category', category,
+            'status', status, 'updated_at', updated_at)::text)
+        FROM (SELECT * FROM new_rows ORDER BY id) AS added;
+    ELSIF TG_OP = 'DELETE' THEN
+        PERFORM pg_notify('item_events', json_build_object(
+            'event_id', nextval('item_event_id_seq'), 'op', 'deleted',
+            'id', id, 'owner_id', owner_id, 'category', category,
+            'status', status)::text)
+        FROM (SELECT * FROM old_rows ORDER BY id) AS removed;
+    ELSE
+        PERFORM pg_notify('item_events', json_build_object(
+            'event_id', nextval('item_event_id_seq'),
+            'op', CASE WHEN n.status = 'published' AND o.status <> 'published'
+                       THEN 'published' ELSE 'updated' END,
+            'id', n.id, 'owner_id', n.owner_id, 'category', n.category,
+            'status', n.status, 'previous_category', o.category,
+            'previous_status', o.status, 'updated_at', n.updated_at)::text)
+        FROM (SELECT * FROM new_rows ORDER BY id) AS n
+        JOIN old_rows AS o USING (id);
+    END IF;
+    RETURN NULL;
+END
+$$
+"""
+
+TRIGGERS = {
+    'item_events_insert': "AFTER INSERT ON item REFERENCING NEW TABLE AS new_rows",
+    'item_events_update': (
+        "AFTER UPDATE ON item REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    'item_events_delete': "AFTER DELETE ON item REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE SEQUENCE item_event_id_seq")
+    op.execute(FUNCTION)
+    for name, definition in TRIGGERS.items():
+        op.execute(f"CREATE TRIGGER {name} {definition} "
+                   "FOR EACH STATEMENT EXECUTE FUNCTION item_events_notify()")
+
+
+def downgrade() -> None:
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER {name} ON item")
+    op.execute("DROP FUNCTION item_events_notify()")
+    op.execute("DROP SEQUENCE item_event_id_seq")
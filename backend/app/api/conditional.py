@@ -0,0 +1,138 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+import hashlib
+import uuid
+
+from fastapi import Request, Response
+
+from app.core.compression import negotiate
+from app.core.response_cache import CachedResponse, ResponseCache
+
+VALIDATOR_HEADERS = ("etag", "last-modified", "age", "x-cache")
+
+
+STAMP_FORMAT = "%Y%m%d%H%M%S%f"
+
+
+def version_stamp(updated_at: datetime) -> str:
+    return updated_at.strftime(STAMP_FORMAT)
+
+
+def resource_etag(obj: Any, *related: Any) -> str:
+    """Strong ETag built from id and updated_at, e.g. "<id>.<stamp>".
+
+    Versions of embedded objects (such as an item's owner) are appended so the
+    tag changes whenever the representation does; If-Match only compares the
+    leading id and stamp of the resource itself.
+    """
+    parts = [obj.id.hex, version_stamp(obj.updated_at)]
+    parts += [version_stamp(other.updated_at) for other in related if other is not None]
+    return '"' + ".".join(parts) + '"'
+
+
+def collection_etag(objects: Iterable[Any], *extra: Optional[str]) -> str:
+    """Strong ETag for a list: a digest over every member's id and version."""
+    digest = hashlib.sha1()
+    for obj in objects:
+        digest.update(f"{obj.id.hex}.{version_stamp(obj.updated_at)};".encode())
+    for value in extra:
+        digest.update(f"|{value or ''}".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored as naive UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def validator_headers(etag: str, objects: Iterable[Any]) -> Dict[str, str]:
+    headers = {"ETag": etag}
+    stamps = [_as_utc(obj.updated_at) for obj in objects if obj is not None]
+    if stamps:
+        headers["Last-Modified"] = format_datetime(max(stamps), usegmt=True)
+    return headers
+
+
+def _etag_listed(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(","))
+
+
+def is_not_modified(request: Request, headers: Mapping[str, str]) -> bool:
+    lowered = {key.lower(): value for key, value in headers.items()}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return "etag" in lowered and _etag_listed(if_none_match, lowered["etag"])
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and "last-modified" in lowered:
+        # A "-0000" zone parses as naive; it still means UTC. A validator
+        # that cannot be compared just means the client copy is stale.
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+            modified = _as_utc(parsedate_to_datetime(lowered["last-modified"]))
+            return modified <= since
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def not_modified(headers: Mapping[str, str]) -> Response:
+    kept = {key: value for key, value in headers.items()
+            if key.lower() in VALIDATOR_HEADERS}
+    return Response(status_code=304, headers=kept)
+
+
+def apply_validators(
+    request: Request, response: Response, etag: str, objects: Iterable[Any]
+) -> Optional[Response]:
+    """Attach ETag/Last-Modified, or return a 304 if the client copy is current."""
+    headers = validator_headers(etag, objects)
+    if is_not_modified(request, headers):
+        return not_modified(headers)
+    response.headers.update(headers)
+    return None
+
+
+def accepted_encoding(request: Request) -> Optional[str]:
+    return negotiate(request.headers.get("accept-encoding"))
+
+
+async def respond_cached(
+    request: Request, cache: ResponseCache, key: Optional[str], entry: CachedResponse
+) -> Response:
+    validators = entry.to_response().headers
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    return await cache.respond(key, entry, accepted_encoding(request))
+
+
+def if_match_versions(
+    if_match: Optional[str], resource_id: uuid.UUID
+) -> Optional[List[datetime]]:
+    """updated_at values If-Match accepts for a resource; None when any will do.
+
+    Lets a conditional UPDATE carry the precondition in its WHERE clause, so
+    a stale write matches no row (answered with 412). An empty list matches
+    no version.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    versions = []
+    for candidate in if_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            # Weak tags never match for If-Match
+            continue
+        parts = candidate.strip('"').split(".")
+        if len(parts) < 2 or parts[0] != resource_id.hex:
+            continue
+        try:
+            versions.append(datetime.strptime(parts[1], STAMP_FORMAT))
+        except ValueError:
+            continue
+    return versions
@@ -1,45 +1,131 @@
-from typing import Annotated, Optional
+from datetime import datetime, timezone
+from typing import Annotated
+import uuid
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from sqlmodel import Session, select
+from prometheus_client import Counter
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.user import User
 from app.models.enums import UserRole
+from app.schemas.auth import UserPrincipal
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+AUTH_CACHE_REQUESTS = Counter(
+    "auth_cache_requests_total",
+    "Authenticated-principal cache lookups",
+    ["cache", "result"],
+)
 
-def get_current_user(
-    db: Annotated[Session, Depends(get_db)],
-    token: Annotated[str, Depends(oauth2_scheme)],
-) -> User:
-    credentials_exception = HTTPException(
+# token -> user id, and user id -> identity snapshot
+token_cache: TTLCache[str, uuid.UUID] = TTLCache(
+    settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+principal_cache: TTLCache[uuid.UUID, UserPrincipal] = TTLCache(
+    settings.AUTH_CACHE_MAX_SIZE, settings.AUTH_CACHE_TTL_SECONDS)
+
+
+def invalidate_principal(user_id: uuid.UUID) -> None:
+    """Drop the cached identity snapshot after the user row changed."""
+    principal_cache.pop(user_id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_user_id(token: str) -> uuid.UUID:
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        AUTH_CACHE_REQUESTS.labels("token", "hit").inc()
+        return user_id
+    AUTH_CACHE_REQUESTS.labels("token", "miss").inc()
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY,
                              algorithms=[settings.ALGORITHM])
-        user_id: Optional[int] = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    statement = select(User).where(User.id == user_id)
-    user = db.exec(statement).first()
+        subject = payload.get("sub")
+        if subject is None:
+            raise _credentials_exception()
+        user_id = uuid.UUID(subject)
+    except (JWTError, ValueError):
+        raise _credentials_exception() from None
+
+    # Never keep a token cached past its own expiry
+    expires_in = payload.get("exp", 0) - datetime.now(timezone.utc).timestamp()
+    token_cache.set(token, user_id, ttl=expires_in)
+    return user_id
+
+
+def _remember(user: User) -> UserPrincipal:
+    principal = UserPrincipal(id=user.id, role=user.role, is_active=user.is_active)
+    principal_cache.set(user.id, principal)
+    return principal
+
+
+async def get_current_principal(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> UserPrincipal:
+    """Identity and role of the caller, served from cache when possible."""
+    user_id = _decode_user_id(token)
+
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        AUTH_CACHE_REQUESTS.labels("principal", "hit").inc()
+        return principal
+    AUTH_CACHE_REQUESTS.labels("principal", "miss").inc()
+
+    user = await db.get(User, user_id)
+    if user is None:
+        raise _credentials_exception()
+    return _remember(user)
+
+
+async def get_current_active_principal(
+    principal: Annotated[UserPrincipal, Depends(get_current_principal)]
+) -> UserPrincipal:
+    if not principal.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+    return principal
+
+
+async def get_current_admin_principal(
+    principal: Annotated[UserPrincipal, Depends(get_current_active_principal)]
+) -> UserPrincipal:
+    if principal.role != UserRole.admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions"
+        )
+    return principal
+
+
+async def get_current_user(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> User:
+    """Full ORM user, for handlers that read or modify the row itself."""
+    user_id = _decode_user_id(token)
+
+    user = await db.get(User, user_id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    _remember(user)
     return user
 
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: Annotated[User, Depends(get_current_user)]
 ) -> User:
     if not current_user.is_active:
@@ -47,7 +133,7 @@ def get_current_active_user(
     return current_user
 
 
-def get_current_admin_user(
+async def get_current_admin_user(
     current_user: Annotated[User, Depends(get_current_active_user)]
 ) -> User:
     if current_user.role != UserRole.admin:
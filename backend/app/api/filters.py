@@ -0,0 +1,74 @@
+from typing import Annotated, Any, Dict, Optional
+
+from fastapi import Query
+from sqlalchemy import false
+
+from app.models.enums import ItemCategory, ItemStatus
+from app.models.item import Item, item_search_query, item_search_vector
+
+
+class ItemFilters:
+    """Item query filters shared by the listing and export endpoints.
+
+    Inject with ``Depends(ItemFilters.from_query)``.
+    """
+
+    def __init__(
+        self,
+        status: Optional[ItemStatus] = None,
+        category: Optional[ItemCategory] = None,
+        is_available: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        search: Optional[str] = None,
+    ):
+        self.status = status
+        self.category = category
+        self.is_available = is_available
+        self.min_price = min_price
+        self.max_price = max_price
+        self.search = " ".join(search.lower().split()) if search else None
+        self.query = item_search_query(search) if search else None
+
+    @classmethod
+    async def from_query(
+        cls,
+        status: Optional[ItemStatus] = None,
+        category: Optional[ItemCategory] = None,
+        is_available: Optional[bool] = None,
+        min_price: Annotated[Optional[float], Query(ge=0)] = None,
+        max_price: Annotated[Optional[float], Query(ge=0)] = None,
+        search: Optional[str] = None,
+    ) -> "ItemFilters":
+        # FastAPI runs sync dependencies, including classes, in the threadpool;
+        # an async one is built on the event loop without a thread hop
+        return cls(status, category, is_available, min_price, max_price, search)
+
+    def apply(self, statement: Any) -> Any:
+        if self.status:
+            statement = statement.where(Item.status == self.status)
+        if self.category:
+            statement = statement.where(Item.category == self.category)
+        if self.is_available is not None:
+            statement = statement.where(Item.is_available == self.is_available)
+        if self.min_price is not None:
+            statement = statement.where(Item.price >= self.min_price)
+        if self.max_price is not None:
+            statement = statement.where(Item.price <= self.max_price)
+        if self.query is not None:
+            statement = statement.where(item_search_vector.bool_op("@@")(self.query))
+        elif self.search:
+            # No words to match (e.g. only punctuation): nothing can match
+            statement = statement.where(false())
+        return statement
+
+    def params(self) -> Dict[str, Any]:
+        """Normalized filter values, e.g. for building cache keys."""
+        return {
+            "status": self.status,
+            "category": self.category,
+            "is_available": self.is_available,
+            "min_price": self.min_price,
+            "max_price": self.max_price,
+            "search": self.search,
+        }
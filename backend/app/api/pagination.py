@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple, TypeVar
+import base64
+import json
+import uuid
+
+from fastapi import HTTPException, Response
+from sqlalchemy import tuple_
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: uuid.UUID) -> str:
+    raw = json.dumps([created_at.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), uuid.UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+def paginate(statement: Any, model: Any, cursor: Optional[str], limit: int) -> Any:
+    """Order newest first by (created_at, id) and seek past the cursor.
+
+    One extra row is fetched so split_page can tell whether a next page
+    exists. The seek predicate is served by the (created_at, id) indexes,
+    so deep pages cost the same as the first one.
+    """
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        statement = statement.where(
+            tuple_(model.created_at, model.id) < tuple_(created_at, row_id))
+    return statement.order_by(
+        model.created_at.desc(), model.id.desc()).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[T], limit: int, response: Response
+) -> List[T]:
+    """Trim the look-ahead row and expose the next cursor as a header."""
+    page = list(rows[:limit])
+    if len(rows) > limit:
+        last: Any = page[-1]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last.created_at, last.id)
+    return page
@@ -0,0 +1,31 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.core.response_cache import render_json
+
+if settings.FAST_JSON_RESPONSES:
+    import orjson  # noqa: F401  optional dependency; fail at startup if missing
+
+# orjson encodes UUIDs and datetimes natively and much faster than json.dumps
+DefaultResponse = ORJSONResponse if settings.FAST_JSON_RESPONSES else JSONResponse
+
+
+def model_response(adapter: TypeAdapter, value: Any, response: Response) -> Any:
+    """Serialize a route's result straight to bytes in fast JSON mode.
+
+    Validation into the public model and JSON encoding both run in
+    pydantic-core, skipping FastAPI's response_model round trip; the adapter
+    must describe the route's declared response model. Headers already set on the
+    injected response are carried over. Otherwise the value is returned as is.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return value
+    return Response(
+        render_json(adapter, value),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
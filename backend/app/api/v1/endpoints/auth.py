@@ -3,14 +3,28 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlmodel import Session, select
-
-from app.api.deps import get_current_active_user
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import (
+    get_current_active_principal,
+    get_current_active_user,
+    invalidate_principal,
+)
 from app.core.config import settings
-from app.core.security import create_access_token, verify_password, get_password_hash
+from app.core.security import (
+    create_access_token,
+    get_password_hash_async,
+    verify_password_async,
+)
 from app.db.session import get_db
 from app.models.user import User, UserPublic
-from app.schemas.auth import LoginRequest, TokenResponse, PasswordChangeRequest
+from app.schemas.auth import (
+    LoginRequest,
+    PasswordChangeRequest,
+    TokenResponse,
+    UserPrincipal,
+)
 from app.schemas.token import Token
 
 router = APIRouter()
@@ -18,14 +32,16 @@ router = APIRouter()
 
 @router.post("/login", response_model=Token)
 async def login(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ):
     """OAuth2 compatible token login, get an access token for future requests"""
     statement = select(User).where(User.email == form_data.username)
-    user = db.exec(statement).first()
+    result = await db.exec(statement)
+    user = result.first()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password_async(
+            form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -49,14 +65,16 @@ async def login(
 
 @router.post("/login-json", response_model=TokenResponse)
 async def login_json(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db)],
     login_data: LoginRequest,
 ):
     """JSON login endpoint that returns user data along with token"""
     statement = select(User).where(User.email == login_data.email)
-    user = db.exec(statement).first()
+    result = await db.exec(statement)
+    user = result.first()
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user or not await verify_password_async(
+            login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -84,7 +102,7 @@ async def login_json(
 
 @router.post("/logout")
 async def logout(
-    _current_user: Annotated[User, Depends(get_current_active_user)]
+    _current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)]
 ):
     # In a real application, you might want to blacklist the token
     # _current_user is used for authentication verification
@@ -95,17 +113,19 @@ async def logout(
 async def change_password(
     password_data: PasswordChangeRequest,
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(
+            password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
 
-    current_user.hashed_password = get_password_hash(
+    current_user.hashed_password = await get_password_hash_async(
         password_data.new_password)
     db.add(current_user)
-    db.commit()
+    await db.commit()
+    invalidate_principal(current_user.id)
 
     return {"message": "Password changed successfully"}
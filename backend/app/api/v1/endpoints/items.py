@@ -1,134 +1,728 @@
-from typing import Annotated, List, Optional
+from collections import defaultdict
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import csv
+import io
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select, or_
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import (
+    Uuid,
+    any_,
+    bindparam,
+    cast,
+    column,
+    delete,
+    func,
+    insert,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import get_current_active_user
-from app.db.session import get_db
-from app.models.item import Item, ItemCreate, ItemPublic, ItemUpdate, ItemPublicWithOwner
+from app.api.conditional import (
+    accepted_encoding,
+    apply_validators,
+    collection_etag,
+    if_match_versions,
+    is_not_modified,
+    not_modified,
+    resource_etag,
+    respond_cached,
+    validator_headers,
+)
+from app.api.deps import get_current_active_principal
+from app.api.filters import ItemFilters
+from app.api.pagination import NEXT_CURSOR_HEADER, paginate, split_page
+from app.api.responses import model_response
+from app.core.config import settings
+from app.core.item_events import item_events
+from app.core.response_cache import item_response_cache, render_json
+from app.db.session import get_db, get_read_db, read_session
+from app.models.item import (
+    ITEM_PRICE_BUCKETS,
+    Item,
+    ItemCreate,
+    ItemPublic,
+    ItemPublicWithOwner,
+    ItemStatsBucket,
+    ItemUpdate,
+    item_search_vector,
+)
+from app.models.enums import DataFormat, ItemCategory, ItemStatus, ItemSort, UserRole
 from app.models.user import User
-from app.models.enums import ItemStatus, ItemCategory, UserRole
+from app.schemas.auth import UserPrincipal
+from app.schemas.bulk import (
+    BulkDeleteResult,
+    BulkItemDelete,
+    BulkItemError,
+    BulkItemResult,
+    ItemBatchRequest,
+    ItemBatchResult,
+    ItemImportError,
+    ItemImportResult,
+)
+from app.schemas.stats import ItemGroupStats, ItemStats, PriceBucketStats
+from app.utils.ingest import iter_csv_rows, iter_ndjson_rows
 
 router = APIRouter()
 
+ITEM_ADAPTER = TypeAdapter(ItemPublicWithOwner)
+ITEM_LIST_ADAPTER = TypeAdapter(List[ItemPublicWithOwner])
+ITEM_PUBLIC_ADAPTER = TypeAdapter(ItemPublic)
+ITEM_PUBLIC_LIST_ADAPTER = TypeAdapter(List[ItemPublic])
+ITEM_BATCH_ADAPTER = TypeAdapter(ItemBatchResult)
+
+EXPORT_FIELDS = list(ItemPublic.model_fields)
+
 
 @router.post("/", response_model=ItemPublic)
 async def create_item(
     item: ItemCreate,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
 ):
-    item_dict = item.model_dump()
-    item_dict["owner_id"] = current_user.id
-
-    db_item = Item(**item_dict)
-    db.add(db_item)
-    db.commit()
-    db.refresh(db_item)
+    # INSERT ... RETURNING: the stored row comes back without a second SELECT
+    statement = insert(Item).values(**item.model_dump(), owner_id=current_user.id)
+    result = await db.exec(statement.returning(Item))
+    db_item = result.scalars().one()
+    await db.commit()
+    await item_response_cache.invalidate()
     return db_item
 
 
 @router.get("/", response_model=List[ItemPublicWithOwner])
 async def read_items(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    request: Request,
+    response: Response,
+    filters: Annotated[ItemFilters, Depends(ItemFilters.from_query)],
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
-    status: Optional[ItemStatus] = None,
-    category: Optional[ItemCategory] = None,
-    is_available: Optional[bool] = None,
-    min_price: Optional[float] = Query(default=None, ge=0),
-    max_price: Optional[float] = Query(default=None, ge=0),
-    search: Optional[str] = None,
-):
-    statement = select(Item)
-
-    # Apply filters
-    if status:
-        statement = statement.where(Item.status == status)
-    if category:
-        statement = statement.where(Item.category == category)
-    if is_available is not None:
-        statement = statement.where(Item.is_available == is_available)
-    if min_price is not None:
-        statement = statement.where(Item.price >= min_price)
-    if max_price is not None:
-        statement = statement.where(Item.price <= max_price)
-    if search:
-        statement = statement.where(
-            or_(
-                Item.title.contains(search),
-                Item.description.contains(search)
-            )
+    cursor: Optional[str] = None,
+    sort: ItemSort = ItemSort.created_at,
+):
+    cache_key = await item_response_cache.list_key({
+        "skip": skip,
+        "limit": limit,
+        "cursor": cursor,
+        "sort": sort,
+        **filters.params(),
+    })
+    cached = await item_response_cache.get(cache_key, "items:list")
+    if cached is not None:
+        return await respond_cached(request, item_response_cache, cache_key, cached)
+
+    # Owners for the whole page are fetched in one extra IN query
+    statement = filters.apply(select(Item).options(selectinload(Item.owner)))
+    query = filters.query
+
+    if sort == ItemSort.relevance and query is not None:
+        if cursor:
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor pagination is not supported with sort=relevance")
+        candidates = (
+            filters.apply(select(Item.id))
+            .order_by(Item.created_at.desc(), Item.id.desc())
+            .limit(settings.SEARCH_RANK_CANDIDATES)
         )
+        rank = func.ts_rank_cd(item_search_vector, query)
+        statement = (
+            statement.where(col(Item.id).in_(candidates))
+            .order_by(rank.desc(), Item.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        result = await db.exec(statement)
+        items = list(result.all())
+    else:
+        statement = paginate(statement, Item, cursor, limit).offset(skip)
+        result = await db.exec(statement)
+        items = split_page(result.all(), limit, response)
 
-    statement = statement.offset(skip).limit(limit)
-    items = db.exec(statement).all()
-    return items
+    # The list version covers every row and owner on the page plus the cursor
+    owners = [item.owner for item in items if item.owner is not None]
+    headers = {
+        **response.headers,
+        **validator_headers(
+            collection_etag(items + owners, response.headers.get(NEXT_CURSOR_HEADER)),
+            items),
+    }
+    if is_not_modified(request, headers):
+        return not_modified(headers)
+    return await item_response_cache.store(
+        cache_key, render_json(ITEM_LIST_ADAPTER, items), headers,
+        accepted_encoding(request))
 
 
 @router.get("/my", response_model=List[ItemPublic])
 async def read_my_items(
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+    response: Response,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = None,
+):
+    statement = select(Item).where(Item.owner_id == current_user.id)
+    statement = paginate(statement, Item, cursor, limit).offset(skip)
+    result = await db.exec(statement)
+    items = split_page(result.all(), limit, response)
+    return model_response(ITEM_PUBLIC_LIST_ADAPTER, items, response)
+
+
+@router.get("/stats", response_model=ItemStats)
+async def read_item_stats(db: Annotated[AsyncSession, Depends(get_read_db)]):
+    """Item totals from the trigger-maintained summary table.
+
+    item_stats holds at most one row per category, status and price bucket,
+    so this never touches the item table.
+    """
+    result = await db.exec(select(ItemStatsBucket))
+    by_category = {category: ItemGroupStats() for category in ItemCategory}
+    by_status = {status: ItemGroupStats() for status in ItemStatus}
+    bounds = [*ITEM_PRICE_BUCKETS, None]
+    prices = [PriceBucketStats(min_price=low, max_price=high)
+              for low, high in zip(bounds, bounds[1:], strict=False)]
+    price_sum = 0.0
+
+    for row in result.all():
+        for group in (by_category[row.category], by_status[row.status]):
+            group.count += row.item_count
+            group.available += row.available_count
+            group.available_quantity += row.available_quantity
+        # width_bucket numbers buckets from 1
+        prices[row.price_bucket - 1].count += row.item_count
+        price_sum += float(row.price_sum)
+
+    total = sum(group.count for group in by_status.values())
+    return ItemStats(
+        total=total,
+        available=sum(group.available for group in by_status.values()),
+        available_quantity=sum(
+            group.available_quantity for group in by_status.values()),
+        average_price=round(price_sum / total, 2) if total else None,
+        by_category=by_category,
+        by_status=by_status,
+        price_distribution=prices,
+    )
+
+
+@router.get("/stream")
+async def stream_item_events(
+    category: Annotated[Optional[List[ItemCategory]], Query()] = None,
+    status: Annotated[Optional[List[ItemStatus]], Query()] = None,
+    last_event_id: Annotated[Optional[int], Header()] = None,
+):
+    """Server-Sent Events for item creates, updates, publishes and deletes.
+
+    Events carry the item id, owner and filterable fields; fetch full items
+    through /items/batch. Reconnecting with Last-Event-ID replays missed
+    events while they are still buffered, otherwise a ``resync`` event asks
+    the client to refetch.
+    """
+    if not settings.ITEM_EVENTS_ENABLED:
+        raise HTTPException(status_code=404, detail="Item change feed is disabled")
+    if not item_events.running:
+        raise HTTPException(status_code=503, detail="Item change feed is unavailable")
+    body = item_events.stream(
+        frozenset(value.value for value in category) if category else None,
+        frozenset(value.value for value in status) if status else None,
+        last_event_id,
+        settings.ITEM_EVENTS_HEARTBEAT_SECONDS,
+    )
+    return StreamingResponse(
+        body,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _read_items_batch(
+    db: AsyncSession, ids: List[uuid.UUID], request: Request, response: Response
+):
+    """Resolve many ids at once, answering in request order.
+
+    A single ``id = ANY(:ids)`` query keeps one statement shape whatever the
+    number of ids; owners follow in one IN query.
+    """
+    unique_ids = list(dict.fromkeys(ids))
+    id_array = bindparam("ids", unique_ids, type_=ARRAY(Uuid()))
+    result = await db.exec(
+        select(Item)
+        .where(col(Item.id) == any_(id_array))
+        .options(selectinload(Item.owner)))
+    found = {item.id: item for item in result.all()}
+
+    items = [found.get(item_id) for item_id in ids]
+    not_found = [item_id for item_id in unique_ids if item_id not in found]
+    owners = [item.owner for item in found.values() if item.owner is not None]
+    etag = collection_etag(
+        [*found.values(), *owners], ",".join(item_id.hex for item_id in ids))
+    not_modified = apply_validators(request, response, etag, found.values())
+    return not_modified or model_response(
+        ITEM_BATCH_ADAPTER, {"items": items, "not_found": not_found}, response)
+
+
+@router.get("/batch", response_model=ItemBatchResult)
+async def read_items_batch(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    request: Request,
+    response: Response,
+    ids: Annotated[
+        List[str], Query(description="Item ids, comma-separated or repeated")],
 ):
-    statement = select(Item).where(
-        Item.owner_id == current_user.id).offset(skip).limit(limit)
-    items = db.exec(statement).all()
-    return items
+    """Items for up to BATCH_MAX_IDS ids; POST the ids for longer lists."""
+    try:
+        item_ids = [uuid.UUID(part.strip()) for value in ids
+                    for part in value.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=422, detail="ids must be item UUIDs") from None
+    if not 1 <= len(item_ids) <= settings.BATCH_MAX_IDS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Between 1 and {settings.BATCH_MAX_IDS} ids are accepted")
+    return await _read_items_batch(db, item_ids, request, response)
+
+
+@router.post("/batch", response_model=ItemBatchResult)
+async def read_items_batch_post(
+    payload: ItemBatchRequest,
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    request: Request,
+    response: Response,
+):
+    return await _read_items_batch(db, payload.ids, request, response)
+
+
+async def _export_rows(
+    request: Request, filters: ItemFilters, export_format: DataFormat
+) -> AsyncIterator[bytes]:
+    # Dependencies with yield are torn down before a streaming body is sent,
+    # so the export owns its session for the lifetime of the stream.
+    statement = filters.apply(
+        select(*(getattr(Item, name) for name in EXPORT_FIELDS))
+    ).order_by(Item.created_at, Item.id)
+
+    if export_format == DataFormat.csv:
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+        writer.writeheader()
+        yield buffer.getvalue().encode()
+
+    async with read_session(request.headers.get("authorization")) as session:
+        # Server-side cursor: at most one batch of rows is held in memory
+        result = await session.stream(
+            statement, execution_options={"yield_per": settings.EXPORT_BATCH_SIZE})
+        async for rows in result.mappings().partitions():
+            if await request.is_disconnected():
+                break
+            records = [ItemPublic.model_validate(dict(row)) for row in rows]
+            if export_format == DataFormat.csv:
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+                writer.writerows(record.model_dump(mode="json") for record in records)
+                chunk = buffer.getvalue().encode()
+            else:
+                chunk = b"".join(
+                    ITEM_PUBLIC_ADAPTER.dump_json(record) + b"\n" for record in records)
+            # Awaiting the send applies the transport's backpressure to the cursor
+            yield chunk
+
+
+@router.get("/export")
+async def export_items(
+    request: Request,
+    filters: Annotated[ItemFilters, Depends(ItemFilters.from_query)],
+    format: DataFormat = DataFormat.ndjson,
+):
+    """Stream every matching item as NDJSON or CSV in constant memory."""
+    media_type = "text/csv" if format == DataFormat.csv else "application/x-ndjson"
+    return StreamingResponse(
+        _export_rows(request, filters, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="items.{format.value}"'},
+    )
+
+
+IMPORT_COLUMNS = (
+    "title", "description", "price", "quantity", "category", "status", "is_available")
+
+# ON COMMIT DROP keeps the staging table private to this transaction
+IMPORT_STAGING_SQL = """
+CREATE TEMP TABLE item_import_staging (
+    title text, description text, price float8, quantity integer,
+    category text, status text, is_available boolean
+) ON COMMIT DROP
+"""
+
+IMPORT_MERGE_SQL = """
+INSERT INTO item (id, title, description, price, quantity, category, status,
+                  is_available, owner_id, created_at, updated_at)
+SELECT gen_random_uuid(), title, description, price, quantity,
+       category::itemcategory, status::itemstatus, is_available,
+       %(owner_id)s, now(), now()
+FROM item_import_staging
+"""
+
+
+@router.post("/import", response_model=ItemImportResult)
+async def import_items(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+    format: Optional[DataFormat] = None,
+):
+    """Bulk-load a streamed CSV or NDJSON body through COPY.
+
+    Rows are validated against ItemCreate as they arrive; valid rows are
+    copied into a staging table and merged in one INSERT ... SELECT.
+    """
+    if format is None:
+        content_type = request.headers.get("content-type", "")
+        format = DataFormat.csv if "csv" in content_type else DataFormat.ndjson
+    parse = iter_csv_rows if format == DataFormat.csv else iter_ndjson_rows
+
+    rejected = 0
+    errors: List[ItemImportError] = []
+
+    def reject(row: int, detail: Any) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < settings.IMPORT_MAX_REPORTED_ERRORS:
+            errors.append(ItemImportError(row=row, detail=detail))
+
+    # COPY runs on the session's own psycopg connection and transaction
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    async with raw.driver_connection.cursor() as cursor:
+        await cursor.execute(IMPORT_STAGING_SQL)
+        copy_sql = f"COPY item_import_staging ({', '.join(IMPORT_COLUMNS)}) FROM STDIN"
+        try:
+            async with cursor.copy(copy_sql) as copy:
+                async for batch in parse(request.stream()):
+                    for row, record in batch:
+                        if isinstance(record, Exception):
+                            reject(row, str(record))
+                            continue
+                        try:
+                            item = ItemCreate.model_validate(record)
+                        except ValidationError as exc:
+                            reject(row, exc.errors(include_url=False))
+                            continue
+                        await copy.write_row((
+                            item.title, item.description, item.price, item.quantity,
+                            item.category.value, item.status.value, item.is_available))
+        except UnicodeDecodeError:
+            await db.rollback()
+            raise HTTPException(
+                status_code=400, detail="Body must be UTF-8 encoded") from None
+        await cursor.execute(IMPORT_MERGE_SQL, {"owner_id": current_user.id})
+        inserted = cursor.rowcount
+
+    await db.commit()
+    if inserted:
+        await item_response_cache.invalidate()
+    return ItemImportResult(inserted=inserted, rejected=rejected, errors=errors)
+
+
+def _check_owner(
+    owners: Dict[uuid.UUID, uuid.UUID],
+    item_id: uuid.UUID,
+    current_user: UserPrincipal,
+) -> Optional[Tuple[int, str]]:
+    if item_id not in owners:
+        return 404, "Item not found"
+    if owners[item_id] != current_user.id and current_user.role != UserRole.admin:
+        return 403, "Not enough permissions"
+    return None
+
+
+def _writable_item(item_id: uuid.UUID, current_user: UserPrincipal) -> List[Any]:
+    """WHERE conditions for writing an item the principal may modify."""
+    conditions = [Item.id == item_id]
+    if current_user.role != UserRole.admin:
+        conditions.append(Item.owner_id == current_user.id)
+    return conditions
+
+
+async def _missed_item(
+    db: AsyncSession, item_id: uuid.UUID, current_user: UserPrincipal
+) -> None:
+    """After a conditional write matched no row, raise 404/403 if that is why.
+
+    Only failed writes pay for this extra SELECT; when it returns, the row
+    exists and is writable, so the write's own extra condition failed.
+    """
+    owners = await _load_owners(db, [item_id])
+    failure = _check_owner(owners, item_id, current_user)
+    if failure:
+        raise HTTPException(status_code=failure[0], detail=failure[1])
+
+
+async def _load_owners(
+    db: AsyncSession, item_ids: List[uuid.UUID]
+) -> Dict[uuid.UUID, uuid.UUID]:
+    """Ownership of a whole batch in one query."""
+    result = await db.exec(
+        select(Item.id, Item.owner_id).where(col(Item.id).in_(item_ids)))
+    return {item_id: owner_id for item_id, owner_id in result.all()}
+
+
+@router.post("/bulk", response_model=BulkItemResult)
+async def create_items_bulk(
+    records: Annotated[List[Dict[str, Any]], Body(max_length=settings.BULK_MAX_ITEMS)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+):
+    rows: List[Dict[str, Any]] = []
+    errors: List[BulkItemError] = []
+    for index, record in enumerate(records):
+        try:
+            item = ItemCreate.model_validate(record)
+        except ValidationError as exc:
+            errors.append(BulkItemError(
+                index=index, status_code=422, detail=exc.errors(include_url=False)))
+            continue
+        rows.append({**item.model_dump(), "owner_id": current_user.id})
+
+    items: List[Item] = []
+    if rows:
+        # Multi-row INSERT ... RETURNING in a single transaction
+        result = await db.exec(insert(Item).returning(Item), params=rows)
+        items = list(result.scalars().all())
+        await db.commit()
+        await item_response_cache.invalidate()
+    return BulkItemResult(items=items, errors=errors)
+
+
+def _bulk_update_changes(
+    index: int, record: Dict[str, Any]
+) -> Union[Tuple[uuid.UUID, Dict[str, Any]], BulkItemError]:
+    """The item id and column changes of one bulk update record, or its error."""
+    fields = dict(record)
+    try:
+        item_id = uuid.UUID(str(fields.pop("id")))
+    except (KeyError, ValueError):
+        return BulkItemError(
+            index=index, status_code=422, detail="A valid item id is required")
+    try:
+        item_update = ItemUpdate.model_validate(fields)
+    except ValidationError as exc:
+        return BulkItemError(
+            index=index, id=item_id, status_code=422,
+            detail=exc.errors(include_url=False))
+    changes = item_update.model_dump(exclude_unset=True)
+    # ItemUpdate allows null to mean "unchanged" in its type, but an
+    # explicit null on a NOT NULL column would fail the shared UPDATE
+    table = Item.__table__
+    nulls = [name for name, value in changes.items()
+             if value is None and not table.c[name].nullable]
+    if nulls:
+        return BulkItemError(
+            index=index, id=item_id, status_code=422,
+            detail=[{"type": "null_not_allowed", "loc": [name],
+                     "msg": "Field may not be null", "input": None}
+                    for name in nulls])
+    if not changes:
+        return BulkItemError(
+            index=index, id=item_id, status_code=422, detail="No fields to update")
+    return item_id, changes
+
+
+def _partition_bulk_updates(
+    records: List[Dict[str, Any]],
+) -> Tuple[Dict[uuid.UUID, Tuple[int, Dict[str, Any]]], List[BulkItemError]]:
+    """Valid changes by item id (with their record index), and per-record errors."""
+    updates: Dict[uuid.UUID, Tuple[int, Dict[str, Any]]] = {}
+    errors: List[BulkItemError] = []
+    seen: Dict[uuid.UUID, List[int]] = defaultdict(list)
+    for index, record in enumerate(records):
+        outcome = _bulk_update_changes(index, record)
+        if isinstance(outcome, BulkItemError):
+            errors.append(outcome)
+            item_id = outcome.id
+        else:
+            item_id, changes = outcome
+            updates[item_id] = (index, changes)
+        if item_id is not None:
+            seen[item_id].append(index)
+
+    # A repeated id is ambiguous, so none of its records are applied
+    for item_id, indexes in seen.items():
+        if len(indexes) > 1:
+            updates.pop(item_id, None)
+            errors = [error for error in errors if error.id != item_id]
+            errors.extend(
+                BulkItemError(
+                    index=index, id=item_id, status_code=422,
+                    detail=f"Item id is repeated at indexes {indexes}")
+                for index in indexes)
+    return updates, errors
+
+
+@router.patch("/bulk", response_model=BulkItemResult)
+async def update_items_bulk(
+    records: Annotated[List[Dict[str, Any]], Body(max_length=settings.BULK_MAX_ITEMS)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+):
+    table = Item.__table__
+    updates, errors = _partition_bulk_updates(records)
+
+    owners = await _load_owners(db, list(updates))
+    # Records touching the same columns share one UPDATE ... FROM (VALUES ...)
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+    for item_id, (index, fields) in updates.items():
+        failure = _check_owner(owners, item_id, current_user)
+        if failure:
+            errors.append(BulkItemError(
+                index=index, id=item_id, status_code=failure[0], detail=failure[1]))
+        else:
+            groups[tuple(sorted(fields))].append({"id": item_id, **fields})
+
+    items: List[Item] = []
+    for names, rows in groups.items():
+        data = values(
+            *(column(name, table.c[name].type) for name in ("id", *names)),
+            name="batch",
+        ).data([tuple(row[name] for name in ("id", *names)) for row in rows])
+        statement = (
+            update(Item)
+            .where(Item.id == data.c.id)
+            .values({name: cast(data.c[name], table.c[name].type) for name in names})
+            .returning(Item)
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.exec(statement)
+        items.extend(result.scalars().all())
+
+    if items:
+        await db.commit()
+        await item_response_cache.invalidate(*(item.id for item in items))
+    errors.sort(key=lambda error: error.index)
+    return BulkItemResult(items=items, errors=errors)
+
+
+@router.delete("/bulk", response_model=BulkDeleteResult)
+async def delete_items_bulk(
+    payload: BulkItemDelete,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+):
+    owners = await _load_owners(db, payload.ids)
+    allowed: List[uuid.UUID] = []
+    errors: List[BulkItemError] = []
+    for index, item_id in enumerate(payload.ids):
+        failure = _check_owner(owners, item_id, current_user)
+        if failure:
+            errors.append(BulkItemError(
+                index=index, id=item_id, status_code=failure[0], detail=failure[1]))
+        else:
+            allowed.append(item_id)
+
+    deleted: List[uuid.UUID] = []
+    if allowed:
+        result = await db.exec(
+            delete(Item).where(col(Item.id).in_(allowed)).returning(Item.id))
+        deleted = list(result.scalars().all())
+        await db.commit()
+        await item_response_cache.invalidate(*deleted)
+    return BulkDeleteResult(deleted=deleted, errors=errors)
 
 
 @router.get("/{item_id}", response_model=ItemPublicWithOwner)
 async def read_item(
     item_id: uuid.UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    request: Request,
 ):
-    item = db.get(Item, item_id)
+    cache_key = await item_response_cache.detail_key(item_id)
+    cached = await item_response_cache.get(cache_key, "items:detail")
+    if cached is not None:
+        return await respond_cached(request, item_response_cache, cache_key, cached)
+
+    item = await db.get(Item, item_id, options=[joinedload(Item.owner)])
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
-    return item
+
+    headers = validator_headers(resource_etag(item, item.owner), [item, item.owner])
+    if is_not_modified(request, headers):
+        return not_modified(headers)
+    return await item_response_cache.store(
+        cache_key, render_json(ITEM_ADAPTER, item), headers, accepted_encoding(request))
 
 
 @router.patch("/{item_id}", response_model=ItemPublic)
 async def update_item(
     item_id: uuid.UUID,
     item_update: ItemUpdate,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+    response: Response,
+    if_match: Annotated[Optional[str], Header()] = None,
 ):
-    item = db.get(Item, item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    # Check permissions
-    if item.owner_id != current_user.id and current_user.role != UserRole.admin:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
-    # Only owner or admin can change status to published
-    if item_update.status == ItemStatus.published:
-        if item.owner_id != current_user.id and current_user.role != UserRole.admin:
-            raise HTTPException(
-                status_code=403, detail="Only owner or admin can publish items")
+    conditions = _writable_item(item_id, current_user)
+    # Optimistic concurrency: clients may send the ETag they last saw
+    versions = if_match_versions(if_match, item_id)
+    if versions is not None:
+        conditions.append(col(Item.updated_at).in_(versions))
 
     item_data = item_update.model_dump(exclude_unset=True)
-    for key, value in item_data.items():
-        setattr(item, key, value)
+    if item_data:
+        statement = (
+            update(Item)
+            .where(*conditions)
+            .values(item_data)
+            .returning(Item)
+            .execution_options(synchronize_session=False)
+        )
+        item = (await db.exec(statement)).scalars().first()
+    else:
+        item = (await db.exec(select(Item).where(*conditions))).first()
+    if item is None:
+        await _missed_item(db, item_id, current_user)
+        raise HTTPException(status_code=412, detail="Resource has been modified")
+    # Same validators as GET /{item_id}, whose representation embeds the owner
+    owner = await db.get(User, item.owner_id)
 
-    db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await item_response_cache.invalidate(item_id)
+    response.headers.update(
+        validator_headers(resource_etag(item, owner), [item, owner]))
     return item
 
 
 @router.delete("/{item_id}")
 async def delete_item(
     item_id: uuid.UUID,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
 ):
-    item = db.get(Item, item_id)
+    item = await db.get(Item, item_id)
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
@@ -136,31 +730,33 @@ async def delete_item(
     if item.owner_id != current_user.id and current_user.role != UserRole.admin:
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
+    await item_response_cache.invalidate(item_id)
     return {"message": "Item deleted successfully"}
 
 
 @router.post("/{item_id}/publish", response_model=ItemPublic)
 async def publish_item(
     item_id: uuid.UUID,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
 ):
-    item = db.get(Item, item_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
-    # Check permissions
-    if item.owner_id != current_user.id and current_user.role != UserRole.admin:
-        raise HTTPException(status_code=403, detail="Not enough permissions")
-
-    if item.status == ItemStatus.published:
-        raise HTTPException(
-            status_code=400, detail="Item is already published")
+    # The status check lives in the WHERE clause, so of two concurrent
+    # publishes exactly one succeeds
+    statement = (
+        update(Item)
+        .where(*_writable_item(item_id, current_user),
+               Item.status != ItemStatus.published)
+        .values(status=ItemStatus.published)
+        .returning(Item)
+        .execution_options(synchronize_session=False)
+    )
+    item = (await db.exec(statement)).scalars().first()
+    if item is None:
+        await _missed_item(db, item_id, current_user)
+        raise HTTPException(status_code=409, detail="Item is already published")
 
-    item.status = ItemStatus.published
-    db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await item_response_cache.invalidate(item_id)
     return item
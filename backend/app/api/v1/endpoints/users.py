@@ -1,54 +1,130 @@
 from typing import Annotated, List, Optional
+import logging
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlmodel import Session, select, col
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from pydantic import TypeAdapter
+from sqlalchemy import delete, update
+from sqlmodel import select, col, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.deps import get_current_active_user, get_current_admin_user
-from app.core.security import get_password_hash
-from app.db.session import get_db
+from app.api.conditional import apply_validators, collection_etag, resource_etag
+from app.api.deps import (
+    get_current_active_principal,
+    get_current_active_user,
+    get_current_admin_principal,
+    invalidate_principal,
+)
+from app.api.pagination import NEXT_CURSOR_HEADER, paginate, split_page
+from app.api.responses import model_response
+from app.core.config import settings
+from app.core.response_cache import item_response_cache
+from app.core.security import get_password_hash_async
+from app.db.session import AsyncSessionLocal, get_db, get_read_db
+from app.models.item import Item
 from app.models.user import User, UserCreate, UserPublic, UserUpdate, UserPublicWithItems
 from app.models.enums import UserRole
+from app.schemas.auth import UserPrincipal
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+USER_LIST_ADAPTER = TypeAdapter(List[UserPublic])
+USER_WITH_ITEMS_ADAPTER = TypeAdapter(UserPublicWithItems)
+
+
+def _includes_items(include: Optional[str]) -> bool:
+    return "items" in {part.strip() for part in (include or "").split(",")}
+
+
+async def _profile_response(
+    db: AsyncSession,
+    user: User,
+    request: Request,
+    response: Response,
+    include: Optional[str],
+    items_cursor: Optional[str],
+    items_limit: int,
+):
+    """A user with their item count and, if requested, one page of their items.
+
+    The page uses the same keyset pagination as the item listings (next page
+    cursor in X-Next-Cursor), so the items relationship is never loaded whole.
+    """
+    count = select(func.count()).select_from(Item).where(Item.owner_id == user.id)
+    items_count = (await db.exec(count)).one()
+    items = None
+    if _includes_items(include):
+        statement = select(Item).where(Item.owner_id == user.id)
+        statement = paginate(statement, Item, items_cursor, items_limit)
+        items = split_page((await db.exec(statement)).all(), items_limit, response)
+
+    versioned = [user, *(items or [])]
+    etag = collection_etag(
+        versioned, str(items_count), "items" if items is not None else None,
+        response.headers.get(NEXT_CURSOR_HEADER))
+    not_modified = apply_validators(request, response, etag, versioned)
+    if not_modified:
+        return not_modified
+    profile = UserPublicWithItems.model_validate(
+        user, update={"items_count": items_count, "items": items})
+    return model_response(USER_WITH_ITEMS_ADAPTER, profile, response)
+
 
 @router.post("/", response_model=UserPublic)
 async def create_user(
     user: UserCreate,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db)],
 ):
     statement = select(User).where(User.email == user.email)
-    db_user = db.exec(statement).first()
+    result = await db.exec(statement)
+    db_user = result.first()
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
     user_dict = user.model_dump(exclude={"password"})
-    user_dict["hashed_password"] = get_password_hash(user.password)
+    user_dict["hashed_password"] = await get_password_hash_async(user.password)
 
     db_user = User(**user_dict)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
 @router.get("/me", response_model=UserPublicWithItems)
 async def read_users_me(
     current_user: Annotated[User, Depends(get_current_active_user)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    request: Request,
+    response: Response,
+    include: Optional[str] = Query(
+        default=None, description="Set to 'items' to embed a page of owned items"),
+    items_cursor: Optional[str] = None,
+    items_limit: int = Query(default=20, ge=1, le=100),
 ):
-    # Refresh to get relationships
-    db.refresh(current_user)
-    return current_user
+    return await _profile_response(
+        db, current_user, request, response, include, items_cursor, items_limit)
 
 
 @router.get("/", response_model=List[UserPublic])
 async def read_users(
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_admin_principal)],
+    request: Request,
+    response: Response,
     skip: int = Query(default=0, ge=0),
     limit: int = Query(default=100, ge=1, le=100),
+    cursor: Optional[str] = None,
     role: Optional[UserRole] = None,
     is_active: Optional[bool] = None,
 ):
@@ -59,42 +135,53 @@ async def read_users(
     if is_active is not None:
         statement = statement.where(User.is_active == is_active)
 
-    statement = statement.offset(skip).limit(limit)
-    users = db.exec(statement).all()
-    return users
+    statement = paginate(statement, User, cursor, limit).offset(skip)
+    result = await db.exec(statement)
+    users = split_page(result.all(), limit, response)
+    not_modified = apply_validators(
+        request, response,
+        collection_etag(users, response.headers.get(NEXT_CURSOR_HEADER)), users)
+    return not_modified or model_response(USER_LIST_ADAPTER, users, response)
 
 
 @router.get("/{user_id}", response_model=UserPublicWithItems)
 async def read_user(
     user_id: uuid.UUID,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
+    request: Request,
+    response: Response,
+    include: Optional[str] = Query(
+        default=None, description="Set to 'items' to embed a page of owned items"),
+    items_cursor: Optional[str] = None,
+    items_limit: int = Query(default=20, ge=1, le=100),
 ):
-    user = db.get(User, user_id)
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     # Check permissions
     if current_user.id != user_id and current_user.role != UserRole.admin:
         # Return basic info only
-        return UserPublic.model_validate(user)
+        not_modified = apply_validators(request, response, resource_etag(user), [user])
+        return not_modified or model_response(
+            USER_WITH_ITEMS_ADAPTER, UserPublic.model_validate(user), response)
 
-    return user
+    return await _profile_response(
+        db, user, request, response, include, items_cursor, items_limit)
 
 
 @router.patch("/{user_id}", response_model=UserPublic)
 async def update_user(
     user_id: uuid.UUID,
     user_update: UserUpdate,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_active_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_active_principal)],
 ):
-    user = db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Check permissions
+    # Check permissions; telling 404 from 403 costs a lookup only on refusal
     if current_user.id != user_id and current_user.role != UserRole.admin:
+        if await db.get(User, user_id) is None:
+            raise HTTPException(status_code=404, detail="User not found")
         raise HTTPException(status_code=403, detail="Not enough permissions")
 
     # Only admin can change roles
@@ -103,32 +190,91 @@ async def update_user(
             status_code=403, detail="Only admin can change user roles")
 
     user_data = user_update.model_dump(exclude_unset=True)
-    if "password" in user_data and user_data["password"]:
-        user_data["hashed_password"] = get_password_hash(
-            user_data.pop("password"))
+    # password is not a column: an empty one leaves the hash unchanged
+    password = user_data.pop("password", None)
+    if password:
+        user_data["hashed_password"] = await get_password_hash_async(password)
 
-    for key, value in user_data.items():
-        setattr(user, key, value)
+    if user_data:
+        statement = (
+            update(User)
+            .where(User.id == user_id)
+            .values(user_data)
+            .returning(User)
+            .execution_options(synchronize_session=False)
+        )
+        user = (await db.exec(statement)).scalars().first()
+    else:
+        user = (await db.exec(select(User).where(User.id == user_id))).first()
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
 
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    invalidate_principal(user.id)
+    # Item responses embed the owner's public profile
+    await item_response_cache.invalidate_all()
     return user
 
 
+async def _delete_user_in_chunks(user_id: uuid.UUID) -> None:
+    """Delete a large owner's items a chunk per transaction, then the user.
+
+    Short transactions keep row locks and WAL bursts small while the API
+    keeps serving. The user is deactivated beforehand; if the job is
+    interrupted, deleting the user again resumes it.
+    """
+    chunk = (
+        select(Item.id)
+        .where(Item.owner_id == user_id)
+        .limit(settings.USER_DELETE_CHUNK_SIZE)
+    )
+    deleted = settings.USER_DELETE_CHUNK_SIZE
+    while deleted == settings.USER_DELETE_CHUNK_SIZE:
+        async with AsyncSessionLocal() as db:
+            result = await db.exec(delete(Item).where(col(Item.id).in_(chunk)))
+            await db.commit()
+            deleted = result.rowcount
+            await item_response_cache.invalidate_all()
+
+    async with AsyncSessionLocal() as db:
+        await db.exec(delete(User).where(User.id == user_id))
+        await db.commit()
+    logger.info("Deleted user %s in the background", user_id)
+
+
 @router.delete("/{user_id}")
 async def delete_user(
     user_id: uuid.UUID,
-    db: Annotated[Session, Depends(get_db)],
-    current_user: Annotated[User, Depends(get_current_admin_user)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[UserPrincipal, Depends(get_current_admin_principal)],
+    response: Response,
+    background_tasks: BackgroundTasks,
 ):
-    user = db.get(User, user_id)
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    if user.id == current_user.id:
+    if user_id == current_user.id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
 
-    db.delete(user)
-    db.commit()
+    # Bounded count: only whether the owner is over the threshold matters
+    owned = select(Item.id).where(Item.owner_id == user_id)
+    owned = owned.limit(settings.USER_DELETE_SYNC_MAX_ITEMS + 1).subquery()
+    items_count = (await db.exec(select(func.count()).select_from(owned))).one()
+
+    if items_count > settings.USER_DELETE_SYNC_MAX_ITEMS:
+        # Lock the user out now; the items go in chunks after the response
+        result = await db.exec(
+            update(User).where(User.id == user_id).values(is_active=False))
+        if not result.rowcount:
+            raise HTTPException(status_code=404, detail="User not found")
+        await db.commit()
+        invalidate_principal(user_id)
+        background_tasks.add_task(_delete_user_in_chunks, user_id)
+        response.status_code = 202
+        return {"message": "User deactivated; deletion continues in the background"}
+
+    # Items follow through ON DELETE CASCADE, in this one statement
+    result = await db.exec(delete(User).where(User.id == user_id))
+    if not result.rowcount:
+        raise HTTPException(status_code=404, detail="User not found")
+    await db.commit()
+    invalidate_principal(user_id)
+    await item_response_cache.invalidate_all()
     return {"message": "User deleted successfully"}
@@ -0,0 +1,148 @@
+from typing import Callable, Dict, Optional
+import gzip
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+# Codecs in server preference order; brotli and zstd are optional extras
+CODECS: Dict[str, Callable[[bytes], bytes]] = {}
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    pass
+else:
+    CODECS["zstd"] = lambda body: zstandard.ZstdCompressor(level=3).compress(body)
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    pass
+else:
+    CODECS["br"] = lambda body: brotli.compress(body, quality=4)
+
+# mtime=0 keeps the output deterministic for identical bodies
+CODECS["gzip"] = lambda body: gzip.compress(body, compresslevel=6, mtime=0)
+
+# Event streams must reach the client as each event is written
+STREAMING_TYPES = ("text/event-stream",)
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/problem+json",
+    "application/x-ndjson",
+    "application/javascript",
+    "application/xml",
+)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the preferred available codec the client accepts, if any."""
+    if not settings.COMPRESSION_ENABLED or not accept_encoding:
+        return None
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip().lower()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in CODECS:
+        quality = qualities.get(encoding, qualities.get("*", 0.0))
+        # Ties keep the server's preference order
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(body: bytes) -> bool:
+    return len(body) >= settings.COMPRESSION_MIN_SIZE
+
+
+async def compress(encoding: str, body: bytes) -> bytes:
+    """Compress, moving large bodies off the event loop.
+
+    zlib, brotli and zstd release the GIL while compressing, so a worker
+    thread keeps other requests responsive during big pages.
+    """
+    if len(body) >= settings.COMPRESSION_THREAD_MIN_SIZE:
+        return await run_in_threadpool(CODECS[encoding], body)
+    return CODECS[encoding](body)
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary", "")
+    if "accept-encoding" not in vary.lower():
+        headers["Vary"] = f"{vary}, Accept-Encoding" if vary else "Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """Compresses complete response bodies with the negotiated codec.
+
+    Bodies smaller than COMPRESSION_MIN_SIZE, non-text content types and
+    streaming responses (more than one body message) pass through
+    untouched, as do responses that already carry a Content-Encoding, such
+    as pre-compressed response cache hits.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"))
+        start: Optional[Message] = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                content_type = headers.get("content-type", "")
+                if (not content_type.startswith(COMPRESSIBLE_TYPES)
+                        or content_type.startswith(STREAMING_TYPES)):
+                    passthrough = True
+                    await send(message)
+                    return
+                _add_vary(headers)
+                if encoding is None or "content-encoding" in headers:
+                    passthrough = True
+                    await send(message)
+                    return
+                # Hold the headers until the first body message shows the size
+                start = message
+                return
+
+            if passthrough or start is None:
+                await send(message)
+                return
+
+            pending, start = start, None
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not is_compressible(body):
+                passthrough = True
+                await send(pending)
+                await send(message)
+                return
+
+            body = await compress(encoding, body)
+            headers = MutableHeaders(scope=pending)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            await send(pending)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_wrapper)
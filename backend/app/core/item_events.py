@@ -0,0 +1,224 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, FrozenSet, Optional, Set
+import asyncio
+import json
+import logging
+
+import psycopg
+from prometheus_client import Counter, Gauge
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Must match the channel used by item_events_notify() in the migration
+CHANNEL = "item_events"
+RESYNC = "resync"
+
+# Suggested EventSource reconnect delay, sent when a stream opens
+RETRY_MS = 3000
+
+ITEM_EVENTS = Counter(
+    "item_events_total",
+    "Item change notifications received from Postgres",
+    ["op"],
+)
+ITEM_EVENT_STREAMS = Gauge(
+    "item_event_streams",
+    "Open item change feed streams",
+)
+ITEM_EVENT_STREAMS_DROPPED = Counter(
+    "item_event_streams_dropped_total",
+    "Streams closed because the client fell too far behind",
+)
+
+
+@dataclass
+class ItemEvent:
+    id: Optional[int]
+    op: str
+    data: Dict[str, Any]
+
+    def matches(
+        self, categories: Optional[FrozenSet[str]], statuses: Optional[FrozenSet[str]]
+    ) -> bool:
+        """Whether a filtered stream wants the event.
+
+        Updates match on the old or the new value, so a stream filtered on
+        status=published also learns about items leaving that status.
+        """
+        if self.op == RESYNC:
+            return True
+        for allowed, key in ((categories, "category"), (statuses, "status")):
+            values = {self.data.get(key), self.data.get(f"previous_{key}")}
+            if allowed is not None and not values & allowed:
+                return False
+        return True
+
+    def encode(self) -> bytes:
+        lines = [] if self.id is None else [f"id: {self.id}"]
+        lines.append(f"event: {self.op}")
+        lines.append(f"data: {json.dumps(self.data, separators=(',', ':'))}")
+        return ("\n".join(lines) + "\n\n").encode()
+
+
+class Subscription:
+    """Events waiting to be written to one stream, bounded by ``limit``."""
+
+    def __init__(
+        self,
+        categories: Optional[FrozenSet[str]],
+        statuses: Optional[FrozenSet[str]],
+        limit: int,
+    ):
+        self.categories = categories
+        self.statuses = statuses
+        self.limit = limit
+        self.pending: Deque[ItemEvent] = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def push(self, event: ItemEvent) -> None:
+        if self.closed or not event.matches(self.categories, self.statuses):
+            return
+        if len(self.pending) >= self.limit:
+            # Rather than buffer without bound, end the stream; the client
+            # reconnects with Last-Event-ID and replays what it missed.
+            ITEM_EVENT_STREAMS_DROPPED.inc()
+            self.closed = True
+        else:
+            self.pending.append(event)
+        self.ready.set()
+
+
+class ItemEventBroker:
+    """Fans item change notifications out from one LISTEN connection per worker.
+
+    The last ``replay_size`` events are kept so a reconnecting client can
+    resume from its Last-Event-ID. When that id is no longer buffered, or the
+    LISTEN connection dropped and events may have been missed, streams get a
+    ``resync`` event telling clients to refetch.
+    """
+
+    def __init__(self, replay_size: int, subscriber_buffer: int):
+        self.replay: Deque[ItemEvent] = deque(maxlen=replay_size)
+        self.subscriber_buffer = subscriber_buffer
+        self.subscriptions: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        for subscription in self.subscriptions:
+            subscription.closed = True
+            subscription.ready.set()
+
+    async def _listen(self) -> None:
+        delay, connected_before = 1.0, False
+        while True:
+            try:
+                conn = await psycopg.AsyncConnection.connect(
+                    settings.DATABASE_URL, autocommit=True,
+                    connect_timeout=settings.DB_CONNECT_TIMEOUT)
+                async with conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    if connected_before:
+                        # Notifications sent while disconnected are lost
+                        self.replay.clear()
+                        self.publish(ItemEvent(None, RESYNC, {"reason": "reconnected"}))
+                    connected_before, delay = True, 1.0
+                    async for notify in conn.notifies():
+                        self._receive(notify.payload)
+            except psycopg.OperationalError as exc:
+                logger.warning("Item change feed lost its LISTEN connection: %s", exc)
+            except Exception:
+                logger.exception("Item change feed listener failed, reconnecting")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 30.0)
+
+    def _receive(self, payload: str) -> None:
+        # One bad notification must not take the listener down with it
+        try:
+            self.publish(self._decode(payload))
+        except Exception:
+            logger.exception("Skipping malformed item change notification %r",
+                             payload[:200])
+
+    @staticmethod
+    def _decode(payload: str) -> ItemEvent:
+        data = json.loads(payload)
+        return ItemEvent(data.pop("event_id"), data.pop("op"), data)
+
+    def publish(self, event: ItemEvent) -> None:
+        ITEM_EVENTS.labels(event.op).inc()
+        if event.id is not None:
+            self.replay.append(event)
+        for subscription in self.subscriptions:
+            subscription.push(event)
+
+    def subscribe(
+        self,
+        categories: Optional[FrozenSet[str]],
+        statuses: Optional[FrozenSet[str]],
+        last_event_id: Optional[int],
+    ) -> Subscription:
+        # Room for a full replay, so resuming never overflows on its own
+        subscription = Subscription(
+            categories, statuses, max(self.subscriber_buffer, len(self.replay)))
+        if last_event_id is not None:
+            ids = [event.id for event in self.replay]
+            if last_event_id in ids:
+                for event in list(self.replay)[ids.index(last_event_id) + 1:]:
+                    subscription.push(event)
+            else:
+                subscription.push(ItemEvent(None, RESYNC, {"reason": "expired"}))
+        # No await since the replay: no event can fall between the two
+        self.subscriptions.add(subscription)
+        return subscription
+
+    async def stream(
+        self,
+        categories: Optional[FrozenSet[str]],
+        statuses: Optional[FrozenSet[str]],
+        last_event_id: Optional[int],
+        heartbeat: float,
+    ) -> AsyncIterator[bytes]:
+        """Server-Sent Events for one client, with comment heartbeats."""
+        subscription = self.subscribe(categories, statuses, last_event_id)
+        ITEM_EVENT_STREAMS.inc()
+        try:
+            # Sent at once so headers reach the client before the first event
+            yield f"retry: {RETRY_MS}\n\n".encode()
+            while True:
+                if not subscription.pending and not subscription.closed:
+                    try:
+                        await asyncio.wait_for(subscription.ready.wait(), heartbeat)
+                    except asyncio.TimeoutError:
+                        yield b": heartbeat\n\n"
+                        continue
+                subscription.ready.clear()
+                while subscription.pending:
+                    yield subscription.pending.popleft().encode()
+                if subscription.closed:
+                    return
+        finally:
+            self.subscriptions.discard(subscription)
+            ITEM_EVENT_STREAMS.dec()
+
+
+item_events = ItemEventBroker(
+    settings.ITEM_EVENTS_REPLAY_SIZE, settings.ITEM_EVENTS_SUBSCRIBER_BUFFER)
@@ -0,0 +1,136 @@
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Optional
+import logging
+import time
+
+from prometheus_client import Counter, Histogram
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import route_template
+
+logger = logging.getLogger(__name__)
+
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 500),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per request",
+    ["route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+DB_REPEATED_STATEMENTS = Counter(
+    "http_request_db_repeated_statements_total",
+    "Requests in which one statement shape exceeded the repeat threshold",
+    ["route"],
+)
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    slowest_duration: float = 0.0
+    slowest_statement: Optional[str] = None
+    # Parameterized SQL text -> executions; identical text means identical shape
+    shapes: StatementCounter = field(default_factory=StatementCounter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement] += 1
+        if duration > self.slowest_duration:
+            self.slowest_duration = duration
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        return (f'db;dur={self.duration * 1000:.2f};desc="{self.count} statements", '
+                f"db-slowest;dur={self.slowest_duration * 1000:.2f}")
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None)
+
+
+def before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+    executemany: bool,
+) -> None:
+    if _current_stats.get() is not None:
+        # A connection runs one statement at a time, so one slot suffices
+        conn.info["query_start"] = time.perf_counter()
+
+
+def after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any,
+    executemany: bool,
+) -> None:
+    """Attribute the statement to the request running in this context.
+
+    The async engine runs these hooks in a greenlet that shares the calling
+    task's context, so the stats object set by the middleware is visible.
+    """
+    stats = _current_stats.get()
+    start = conn.info.pop("query_start", None)
+    if stats is None or start is None:
+        return
+    stats.record(statement, time.perf_counter() - start)
+
+
+class QueryStatsMiddleware:
+    """Collects per-request SQL statistics from the engine event hooks.
+
+    Totals are sent in a Server-Timing header and observed into histograms
+    per route template. For streaming responses the header only covers
+    statements issued before the body started; the metrics cover all of them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current_stats.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", stats.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            self._observe(scope, stats)
+
+    def _observe(self, scope: Scope, stats: QueryStats) -> None:
+        route = route_template(scope)
+        DB_STATEMENTS_PER_REQUEST.labels(route).observe(stats.count)
+        DB_TIME_PER_REQUEST.labels(route).observe(stats.duration)
+        if stats.slowest_statement is not None:
+            logger.debug("%s %s: %d statements in %.1fms, slowest %.1fms: %s",
+                         scope["method"], route, stats.count, stats.duration * 1000,
+                         stats.slowest_duration * 1000, stats.slowest_statement)
+
+        threshold = settings.QUERY_REPEAT_WARN_THRESHOLD
+        if threshold <= 0 or not stats.shapes:
+            return
+        statement, repeats = stats.shapes.most_common(1)[0]
+        if repeats > threshold:
+            DB_REPEATED_STATEMENTS.labels(route).inc()
+            logger.warning(
+                "Possible N+1 query in %s %s: statement executed %d times "
+                "(threshold %d): %s",
+                scope["method"], route, repeats, threshold, statement)
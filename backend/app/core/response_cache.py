@@ -0,0 +1,272 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Protocol, Sequence
+from urllib.parse import urlencode
+import hashlib
+import json
+import logging
+import time
+
+from fastapi import Response
+from prometheus_client import Counter
+from pydantic import TypeAdapter
+
+from app.core.cache import TTLCache
+from app.core.compression import compress, is_compressible
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "response_cache_requests_total",
+    "Response cache lookups by route",
+    ["route", "result"],
+)
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    stored_at: float = field(default_factory=time.time)
+    # Content-Encoding -> compressed body, filled in as clients ask for them
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    def to_response(self, encoding: Optional[str] = None, hit: bool = True) -> Response:
+        headers = dict(self.headers)
+        body = self.body
+        if encoding in self.encoded:
+            body = self.encoded[encoding]
+            headers["Content-Encoding"] = encoding
+        if hit:
+            headers["Age"] = str(max(0, int(time.time() - self.stored_at)))
+        headers["X-Cache"] = "HIT" if hit else "MISS"
+        return Response(body, media_type="application/json", headers=headers)
+
+
+class CacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[CachedResponse]: ...
+
+    async def set(self, key: str, entry: CachedResponse, ttl: int) -> None: ...
+
+    async def incr(self, key: str) -> int: ...
+
+    async def incr_expiring(self, keys: Sequence[str], ttl: int) -> None: ...
+
+    async def get_counters(self, keys: Sequence[str]) -> List[int]: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """Per-process LRU backend; also the local stand-in for a shared cache."""
+
+    def __init__(self, maxsize: int, ttl: int):
+        self._entries: TTLCache[str, CachedResponse] = TTLCache(maxsize, ttl)
+        self._counters: Dict[str, int] = {}
+        # Per-object versions, kept longer than the entries keyed by them
+        self._expiring: TTLCache[str, int] = TTLCache(maxsize * 4, ttl * 2)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        return self._entries.get(key)
+
+    async def set(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        self._entries.set(key, entry, ttl=ttl)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def incr_expiring(self, keys: Sequence[str], ttl: int) -> None:
+        for key in keys:
+            self._expiring.set(key, (self._expiring.get(key) or 0) + 1, ttl=ttl)
+
+    async def get_counters(self, keys: Sequence[str]) -> List[int]:
+        return [self._counters.get(key, self._expiring.get(key) or 0) for key in keys]
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Shared backend so every worker sees the same entries and invalidations."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis  # optional dependency
+
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self._client.get(key)
+        if raw is None:
+            return None
+        meta, _, payload = raw.partition(b"\n")
+        header = json.loads(meta)
+        # Payload is the identity body followed by each compressed variant
+        encoded: Dict[str, bytes] = {}
+        end = len(payload)
+        for encoding, size in reversed(header.get("e", [])):
+            encoded[encoding] = payload[end - size:end]
+            end -= size
+        return CachedResponse(body=payload[:end], headers=header["h"],
+                              stored_at=header["t"], encoded=encoded)
+
+    async def set(self, key: str, entry: CachedResponse, ttl: int) -> None:
+        variants = list(entry.encoded.items())
+        meta = json.dumps({
+            "h": entry.headers,
+            "t": entry.stored_at,
+            "e": [[encoding, len(body)] for encoding, body in variants],
+        }).encode()
+        payload = b"".join([meta, b"\n", entry.body, *(body for _, body in variants)])
+        await self._client.set(key, payload, ex=ttl)
+
+    async def incr(self, key: str) -> int:
+        return int(await self._client.incr(key))
+
+    async def incr_expiring(self, keys: Sequence[str], ttl: int) -> None:
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.incr(key)
+                pipe.expire(key, ttl)
+            await pipe.execute()
+
+    async def get_counters(self, keys: Sequence[str]) -> List[int]:
+        return [int(value or 0) for value in await self._client.mget(keys)]
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def render_json(adapter: TypeAdapter, value: Any) -> bytes:
+    """Validate ORM objects into the public model and serialize to bytes."""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+class ResponseCache:
+    """Caches rendered JSON bodies per namespace.
+
+    Keys embed counters read before the database is queried, and
+    invalidation bumps them instead of deleting entries: a miss that read the
+    row before a concurrent write then stores its stale body under a key that
+    is no longer read. Detail keys carry a per-object version; list keys a
+    generation that every write bumps, since any write may move an object in
+    or out of any filtered page. An epoch counter invalidates the whole
+    namespace at once (e.g. when embedded owner data changes).
+    """
+
+    def __init__(self, namespace: str, backend: Optional[CacheBackend], ttl: int):
+        self.namespace = namespace
+        self.backend = backend
+        self.ttl = ttl
+
+    async def _counters(self) -> List[int]:
+        return await self.backend.get_counters(
+            [f"{self.namespace}:epoch", f"{self.namespace}:lists"])
+
+    def _version_key(self, object_id: Any) -> str:
+        return f"{self.namespace}:version:{object_id}"
+
+    async def detail_key(self, object_id: Any) -> Optional[str]:
+        if self.backend is None:
+            return None
+        epoch, version = await self.backend.get_counters(
+            [f"{self.namespace}:epoch", self._version_key(object_id)])
+        return f"{self.namespace}:{epoch}:detail:{object_id}:{version}"
+
+    async def list_key(self, params: Mapping[str, Any]) -> Optional[str]:
+        if self.backend is None:
+            return None
+        epoch, generation = await self._counters()
+        normalized = urlencode(sorted(
+            (name, str(value.value if isinstance(value, Enum) else value))
+            for name, value in params.items() if value is not None))
+        digest = hashlib.sha1(normalized.encode()).hexdigest()
+        return f"{self.namespace}:{epoch}:list:{generation}:{digest}"
+
+    async def get(self, key: Optional[str], route: str) -> Optional[CachedResponse]:
+        if key is None:
+            return None
+        try:
+            entry = await self.backend.get(key)
+        except Exception:
+            logger.warning("Response cache lookup failed", exc_info=True)
+            entry = None
+        RESPONSE_CACHE_REQUESTS.labels(route, "hit" if entry else "miss").inc()
+        return entry
+
+    async def store(
+        self,
+        key: Optional[str],
+        body: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+        encoding: Optional[str] = None,
+    ) -> Response:
+        """Cache a rendered body and return it, compressed for the client.
+
+        The compressed variant is cached alongside the body, so a hot page is
+        compressed once rather than on every hit.
+        """
+        entry = CachedResponse(body=body, headers=dict(headers or {}))
+        await self._encode(entry, encoding)
+        if key is not None:
+            try:
+                await self.backend.set(key, entry, self.ttl)
+            except Exception:
+                logger.warning("Response cache store failed", exc_info=True)
+        return entry.to_response(encoding, hit=False)
+
+    async def respond(
+        self, key: Optional[str], entry: CachedResponse, encoding: Optional[str]
+    ) -> Response:
+        """Serve a hit, adding and persisting a missing compressed variant."""
+        if await self._encode(entry, encoding) and key is not None:
+            remaining = self.ttl - int(time.time() - entry.stored_at)
+            if remaining > 0:
+                try:
+                    await self.backend.set(key, entry, remaining)
+                except Exception:
+                    logger.warning("Response cache store failed", exc_info=True)
+        return entry.to_response(encoding)
+
+    async def _encode(self, entry: CachedResponse, encoding: Optional[str]) -> bool:
+        if encoding is None or encoding in entry.encoded:
+            return False
+        if not is_compressible(entry.body):
+            return False
+        entry.encoded[encoding] = await compress(encoding, entry.body)
+        return True
+
+    async def invalidate(self, *object_ids: Any) -> None:
+        """Forget the given objects and every cached list page."""
+        if self.backend is None:
+            return
+        # Versions must outlive any entry stored under the previous one
+        await self.backend.incr_expiring(
+            [self._version_key(object_id) for object_id in object_ids], self.ttl * 2)
+        await self.backend.incr(f"{self.namespace}:lists")
+
+    async def invalidate_all(self) -> None:
+        if self.backend is not None:
+            await self.backend.incr(f"{self.namespace}:epoch")
+
+    async def close(self) -> None:
+        if self.backend is not None:
+            await self.backend.close()
+
+
+def create_backend() -> Optional[CacheBackend]:
+    if settings.RESPONSE_CACHE_BACKEND == "none":
+        return None
+    if settings.RESPONSE_CACHE_TTL_SECONDS <= 0:
+        return None
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        if not settings.RESPONSE_CACHE_URL:
+            raise ValueError("RESPONSE_CACHE_URL is required for the redis backend")
+        return RedisCacheBackend(settings.RESPONSE_CACHE_URL)
+    return MemoryCacheBackend(
+        settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+
+item_response_cache = ResponseCache(
+    "items", create_backend(), settings.RESPONSE_CACHE_TTL_SECONDS)
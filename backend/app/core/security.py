@@ -1,10 +1,14 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Any, Callable, Optional, Tuple
+import asyncio
+import time
 import warnings
 import os
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from prometheus_client import Counter, Gauge, Histogram
 
 from app.core.config import settings
 
@@ -14,6 +18,25 @@ warnings.filterwarnings("ignore", category=UserWarning, module="passlib")
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time a password hashing job waited for a free worker",
+    ["operation"],
+)
+HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Time spent inside bcrypt per password hashing job",
+    ["operation"],
+)
+HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Password hashing jobs queued or running",
+)
+HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hashing jobs rejected because the queue was full",
+)
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -34,3 +57,82 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHashPoolFull(Exception):
+    """Raised when the password hashing queue is at capacity."""
+
+
+def _timed_call(func: Callable[..., Any], *args: Any) -> Tuple[float, float, Any]:
+    # Runs inside the worker; time.monotonic() is system-wide so the
+    # timestamps are comparable across processes.
+    started = time.monotonic()
+    result = func(*args)
+    return started, time.monotonic(), result
+
+
+class PasswordHasher:
+    """Runs bcrypt on a bounded worker pool instead of the event loop."""
+
+    def __init__(self, workers: int, max_pending: int, use_processes: bool = False):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.use_processes = use_processes
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    async def _run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_pending:
+            HASH_REJECTED.inc()
+            raise PasswordHashPoolFull()
+
+        self._pending += 1
+        HASH_PENDING.inc()
+        submitted = time.monotonic()
+        try:
+            loop = asyncio.get_running_loop()
+            started, finished, result = await loop.run_in_executor(
+                self._get_executor(), _timed_call, func, *args)
+        finally:
+            self._pending -= 1
+            HASH_PENDING.dec()
+
+        HASH_QUEUE_WAIT.labels(operation).observe(max(0.0, started - submitted))
+        HASH_DURATION.labels(operation).observe(finished - started)
+        return result
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(
+            "verify", verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", get_password_hash, password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    use_processes=settings.PASSWORD_HASH_EXECUTOR == "process",
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher.verify(plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.hash(password)
@@ -0,0 +1,115 @@
+from contextlib import AsyncExitStack
+from typing import Dict
+import asyncio
+import time
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to obtain a pooled connection, including opening or pinging it",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0,
+             2.5, 5.0, 10.0, 30.0),
+)
+POOL_OVERFLOW_CONNECTIONS = Counter(
+    "db_pool_overflow_connections_total",
+    "Connections opened beyond pool_size",
+    ["pool"],
+)
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout with every connection in use",
+    ["pool"],
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool recording checkout waits, overflow and timeouts.
+
+    The pool is labelled by the engine's ``pool_logging_name``, which
+    survives the pool being recreated on dispose.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        name = self._orig_logging_name or "default"
+        self._checkout_wait = POOL_CHECKOUT_WAIT.labels(name)
+        self._overflow_connections = POOL_OVERFLOW_CONNECTIONS.labels(name)
+        self._checkout_timeouts = POOL_CHECKOUT_TIMEOUTS.labels(name)
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self._checkout_timeouts.inc()
+            raise
+        finally:
+            self._checkout_wait.observe(time.perf_counter() - start)
+
+    def _inc_overflow(self) -> bool:
+        # The counter starts at -pool_size; only positive values are overflow
+        opened = super()._inc_overflow()
+        if opened and self._overflow > 0:
+            self._overflow_connections.inc()
+        return opened
+
+
+class PoolCollector:
+    """Reports the live state of every registered engine's pool at scrape time.
+
+    Utilization is ``db_pool_checked_out / (db_pool_size + db_pool_max_overflow)``.
+    """
+
+    def __init__(self):
+        self.engines: Dict[str, AsyncEngine] = {}
+
+    def collect(self):
+        families = {
+            "size": GaugeMetricFamily(
+                "db_pool_size", "Persistent connections the pool keeps",
+                labels=["pool"]),
+            "max_overflow": GaugeMetricFamily(
+                "db_pool_max_overflow", "Extra connections allowed under load",
+                labels=["pool"]),
+            "checked_out": GaugeMetricFamily(
+                "db_pool_checked_out", "Connections currently lent to sessions",
+                labels=["pool"]),
+            "idle": GaugeMetricFamily(
+                "db_pool_idle", "Open connections waiting in the pool",
+                labels=["pool"]),
+            "overflow": GaugeMetricFamily(
+                "db_pool_overflow", "Connections currently open beyond pool_size",
+                labels=["pool"]),
+        }
+        for name, engine in self.engines.items():
+            # engine.pool is replaced on dispose, so read it on every scrape
+            pool = engine.pool
+            if not isinstance(pool, InstrumentedQueuePool):
+                continue
+            families["size"].add_metric([name], pool.size())
+            families["max_overflow"].add_metric([name], pool._max_overflow)
+            families["checked_out"].add_metric([name], pool.checkedout())
+            families["idle"].add_metric([name], pool.checkedin())
+            families["overflow"].add_metric([name], max(pool.overflow(), 0))
+        yield from families.values()
+
+
+pool_collector = PoolCollector()
+REGISTRY.register(pool_collector)
+
+
+async def warm_up(engine: AsyncEngine, connections: int) -> None:
+    """Open ``connections`` connections at once and return them to the pool.
+
+    Holding them all open together forces distinct connections, so the
+    first requests after startup skip the connection handshake.
+    """
+    async with AsyncExitStack() as stack:
+        await asyncio.gather(*(stack.enter_async_context(engine.connect())
+                               for _ in range(connections)))
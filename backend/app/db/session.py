@@ -1,10 +1,186 @@
-from sqlmodel import Session, create_engine
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator, List, Optional
+import itertools
+import time
 
+from fastapi import Request
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlmodel import create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.cache import TTLCache
 from app.core.config import settings
+from app.core.query_stats import after_cursor_execute, before_cursor_execute
+from app.db.pool import InstrumentedQueuePool, pool_collector
+
+READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Sessions opened for read-only handlers, by the database serving them",
+    ["target"],
+)
+
+POOL_OPTIONS = dict(
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+
+# Synchronous engine for Alembic, factories and maintenance scripts
+engine = create_engine(
+    settings.DATABASE_URL,
+    echo=False,
+    connect_args={"connect_timeout": settings.DB_CONNECT_TIMEOUT},
+    **POOL_OPTIONS,
+)
+
+
+# Timestamps are stored as naive UTC; pin the session time zone so aware
+# datetimes bound by psycopg 3 are converted consistently.
+CONNECT_OPTIONS = "-c timezone=UTC"
+if settings.ITEM_EVENTS_ENABLED:
+    # The item triggers only NOTIFY the change feed from sessions that opt in
+    CONNECT_OPTIONS += " -c app.item_events=on"
+
+
+def _create_async_engine(url: str, name: str, **kwargs) -> AsyncEngine:
+    async_engine = create_async_engine(
+        url,
+        echo=False,
+        connect_args={"options": CONNECT_OPTIONS,
+                      "connect_timeout": settings.DB_CONNECT_TIMEOUT},
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        **{**POOL_OPTIONS, **kwargs},
+    )
+    pool_collector.engines[name] = async_engine
+    if settings.QUERY_STATS_ENABLED:
+        # Attribute every statement to the request that issued it
+        event.listen(async_engine.sync_engine, "before_cursor_execute",
+                     before_cursor_execute)
+        event.listen(async_engine.sync_engine, "after_cursor_execute",
+                     after_cursor_execute)
+    return async_engine
+
+
+# Async engine used by the API so queries never block the event loop
+async_engine = _create_async_engine(settings.ASYNC_DATABASE_URL, "primary")
+
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
+class ReadReplicas:
+    """Hands out sessions on read replicas, skipping ones that recently failed.
+
+    A replica is marked unhealthy when connecting to it fails or one of its
+    connections is found disconnected, and is retried after
+    READ_REPLICA_RETRY_SECONDS. Callers fall back to the primary when no
+    replica is usable.
+    """
+
+    def __init__(self, urls: List[str], selection: str, retry_seconds: int):
+        # Pre-ping so connections pooled before a replica restart are replaced
+        # at checkout instead of failing the request that draws them
+        self.engines = [
+            _create_async_engine(url, f"replica{index}", pool_pre_ping=True)
+            for index, url in enumerate(urls)
+        ]
+        self.sessionmakers = [
+            async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False)
+            for replica in self.engines
+        ]
+        self.selection = selection
+        self.retry_seconds = retry_seconds
+        self._unhealthy_until = [0.0] * len(urls)
+        self._turn = itertools.count()
+        for index, replica in enumerate(self.engines):
+            event.listen(replica.sync_engine, "handle_error",
+                         partial(self._on_error, index))
 
-engine = create_engine(settings.DATABASE_URL, echo=False)
+    def _on_error(self, index: int, context) -> None:
+        if context.is_disconnect:
+            self.mark_unhealthy(index)
+
+    def mark_unhealthy(self, index: int) -> None:
+        self._unhealthy_until[index] = time.monotonic() + self.retry_seconds
+
+    def candidates(self) -> List[int]:
+        """Healthy replicas, best first."""
+        now = time.monotonic()
+        start = next(self._turn) % len(self.engines)
+        rotated = [(start + offset) % len(self.engines)
+                   for offset in range(len(self.engines))]
+        healthy = [index for index in rotated if self._unhealthy_until[index] <= now]
+        if self.selection == "least_connections":
+            # Stable sort: ties keep the round-robin order
+            healthy.sort(key=lambda index: self.engines[index].pool.checkedout())
+        return healthy
+
+    async def session(self) -> Optional[AsyncSession]:
+        for index in self.candidates():
+            session = self.sessionmakers[index]()
+            try:
+                # Connect now so an unreachable replica falls back right away
+                await session.connection()
+            except (DBAPIError, OSError):
+                await session.close()
+                self.mark_unhealthy(index)
+                continue
+            READ_SESSIONS.labels(f"replica{index}").inc()
+            return session
+        return None
+
+    async def dispose(self) -> None:
+        for replica in self.engines:
+            await replica.dispose()
+
+
+read_replicas = (
+    ReadReplicas(settings.ASYNC_DATABASE_READ_URLS, settings.READ_REPLICA_SELECTION,
+                 settings.READ_REPLICA_RETRY_SECONDS)
+    if settings.ASYNC_DATABASE_READ_URLS else None
+)
+
+# Authorization header -> marker, for clients that committed a write recently.
+# Per process: with several workers, a client's next read may still land on
+# another worker and briefly see replica lag.
+recent_writers: TTLCache[str, bool] = TTLCache(
+    settings.AUTH_CACHE_MAX_SIZE, settings.READ_YOUR_WRITES_SECONDS)
+
+
+@event.listens_for(Session, "after_commit")
+def _remember_commit(session: Session) -> None:
+    session.info["committed"] = True
+
+
+async def get_db(request: Request):
+    async with AsyncSessionLocal() as session:
+        yield session
+        client = request.headers.get("authorization")
+        if client and session.info.get("committed"):
+            recent_writers.set(client, True)
+
+
+@asynccontextmanager
+async def read_session(client: Optional[str] = None) -> AsyncIterator[AsyncSession]:
+    """Session for read-only work: a replica unless the client wrote recently."""
+    session = None
+    if read_replicas is not None and not (client and recent_writers.get(client)):
+        session = await read_replicas.session()
+    if session is None:
+        session = AsyncSessionLocal()
+        READ_SESSIONS.labels("primary").inc()
+    async with session:
+        yield session
 
 
-def get_db():
-    with Session(engine) as session:
+async def get_read_db(request: Request):
+    async with read_session(request.headers.get("authorization")) as session:
         yield session
@@ -1,13 +1,55 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+import logging
+
+from fastapi import FastAPI, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from sqlalchemy.exc import DBAPIError, TimeoutError as PoolTimeoutError
 
+from app.api.responses import DefaultResponse
 from app.api.v1.api import api_router
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.item_events import item_events
+from app.core.metrics import MetricsMiddleware
+from app.core.query_stats import QueryStatsMiddleware
+from app.core.response_cache import item_response_cache
+from app.core.security import PasswordHashPoolFull, password_hasher
+from app.db.pool import warm_up
+from app.db.session import async_engine, read_replicas
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.DB_POOL_WARMUP:
+        engines = [async_engine, *(read_replicas.engines if read_replicas else [])]
+        for engine in engines:
+            try:
+                await warm_up(engine, settings.DB_POOL_SIZE)
+            except (DBAPIError, OSError) as exc:
+                # Serve anyway; connections are opened on demand instead
+                logger.warning("Connection pool warm-up failed for %s: %s",
+                               engine.pool.logging_name, exc)
+    if settings.ITEM_EVENTS_ENABLED:
+        item_events.start()
+    yield
+    await item_events.stop()
+    password_hasher.shutdown()
+    await item_response_cache.close()
+    await async_engine.dispose()
+    if read_replicas is not None:
+        await read_replicas.dispose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 app.add_middleware(
@@ -20,9 +62,41 @@ app.add_middleware(
     max_age=3600,
 )
 
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
+
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.exception_handler(PasswordHashPoolFull)
+async def password_hash_pool_full_handler(request: Request, exc: PasswordHashPoolFull):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(PoolTimeoutError)
+async def pool_timeout_handler(request: Request, exc: PoolTimeoutError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -19,3 +19,13 @@ class ItemCategory(str, Enum):
     books = "books"
     food = "food"
     other = "other"
+
+
+class ItemSort(str, Enum):
+    created_at = "created_at"
+    relevance = "relevance"
+
+
+class DataFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
@@ -1,7 +1,10 @@
 from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
+import re
 import uuid
 
+from sqlalchemy import BigInteger, Column, Computed, Index, Numeric, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, SQLModel, Relationship
 from pydantic import field_validator
 
@@ -27,16 +30,75 @@ class ItemBase(SQLModel):
 
 
 class Item(ItemBase, table=True):
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at, id
+        Index("ix_item_created_at_id", "created_at", "id"),
+        Index("ix_item_owner_id_created_at_id", "owner_id", "created_at", "id"),
+    )
+
     id: Optional[uuid.UUID] = Field(
         default_factory=uuid.uuid4, primary_key=True)
-    owner_id: uuid.UUID = Field(foreign_key="user.id")
+    # Deleting a user deletes their items in the database, in one statement
+    owner_id: uuid.UUID = Field(foreign_key="user.id", ondelete="CASCADE")
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)})
 
     # Relationships
-    owner: Optional["User"] = Relationship(back_populates="items")
+    # Owners must be loaded explicitly (selectinload/joinedload); an implicit
+    # per-row lazy load would reintroduce the N+1 on item listings.
+    owner: Optional["User"] = Relationship(
+        back_populates="items", sa_relationship_kwargs={"lazy": "raise_on_sql"})
+
+
+# Full-text search document, generated by Postgres from title and description.
+# It is attached to the table but deliberately left off the mapper, so it is
+# never loaded or written with the row; queries reference it directly.
+item_search_vector = Column(
+    "search_vector",
+    TSVECTOR,
+    Computed(
+        "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')",
+        persisted=True,
+    ),
+)
+Item.__table__.append_column(item_search_vector)
+Index("ix_item_search_vector", item_search_vector, postgresql_using="gin")
+
+
+def item_search_query(search: str) -> Optional[Any]:
+    """Prefix-matching tsquery for the words in a free-text search string."""
+    terms = re.findall(r"\w+", search)
+    if not terms:
+        return None
+    return func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+
+
+# Lower bounds of the price histogram buckets kept in item_stats; bucket n
+# (as numbered by Postgres width_bucket) covers [bounds[n-1], bounds[n]).
+ITEM_PRICE_BUCKETS = (0, 10, 50, 100, 500, 1000)
+
+
+class ItemStatsBucket(SQLModel, table=True):
+    """Running item totals per category, status and price bucket.
+
+    Maintained by statement-level triggers on item (see the add_item_stats
+    migration), so every write path, including bulk endpoints, imports and
+    COPY seeding, keeps it current. Rebuild with scripts/item_stats.py.
+    """
+
+    __tablename__ = "item_stats"
+
+    category: ItemCategory = Field(primary_key=True)
+    status: ItemStatus = Field(primary_key=True)
+    price_bucket: int = Field(primary_key=True)
+    item_count: int = Field(default=0, sa_type=BigInteger)
+    available_count: int = Field(default=0, sa_type=BigInteger)
+    available_quantity: int = Field(default=0, sa_type=BigInteger)
+    price_sum: float = Field(default=0, sa_type=Numeric)
 
 
 class ItemCreate(ItemBase):
@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from typing import Optional, List, TYPE_CHECKING
 import uuid
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel, Relationship
 
 from app.models.enums import UserRole
@@ -19,16 +20,24 @@ class UserBase(SQLModel):
 
 
 class User(UserBase, table=True):
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at, id
+        Index("ix_user_created_at_id", "created_at", "id"),
+    )
+
     id: Optional[uuid.UUID] = Field(
         default_factory=uuid.uuid4, primary_key=True)
     hashed_password: str
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column_kwargs={"onupdate": lambda: datetime.now(timezone.utc)})
 
     # Relationships
-    items: List["Item"] = Relationship(back_populates="owner")
+    # Items go with their owner through ON DELETE CASCADE; the ORM never
+    # loads them just to delete them
+    items: List["Item"] = Relationship(back_populates="owner", passive_deletes="all")
 
 
 class UserCreate(UserBase):
@@ -52,7 +61,9 @@ class UserPublic(UserBase):
 
 
 class UserPublicWithItems(UserPublic):
-    items: List["ItemPublic"] = []
+    # Owned items in total, and one page of them when ?include=items was given
+    items_count: Optional[int] = None
+    items: Optional[List["ItemPublic"]] = None
 
 
 # Resolve forward references
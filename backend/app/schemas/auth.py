@@ -1,5 +1,9 @@
+import uuid
+
 from pydantic import BaseModel, EmailStr
 
+from app.models.enums import UserRole
+
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -15,3 +19,10 @@ class TokenResponse(BaseModel):
 class PasswordChangeRequest(BaseModel):
     current_password: str
     new_password: str
+
+
+class UserPrincipal(BaseModel):
+    """Identity snapshot of an authenticated user, safe to cache."""
+    id: uuid.UUID
+    role: UserRole
+    is_active: bool
@@ -0,0 +1,49 @@
+from typing import Any, List, Optional
+import uuid
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+from app.models.item import ItemPublic, ItemPublicWithOwner
+
+
+class BulkItemError(BaseModel):
+    index: int
+    id: Optional[uuid.UUID] = None
+    status_code: int
+    detail: Any
+
+
+class BulkItemResult(BaseModel):
+    items: List[ItemPublic] = []
+    errors: List[BulkItemError] = []
+
+
+class BulkItemDelete(BaseModel):
+    ids: List[uuid.UUID] = Field(min_length=1, max_length=settings.BULK_MAX_ITEMS)
+
+
+class BulkDeleteResult(BaseModel):
+    deleted: List[uuid.UUID] = []
+    errors: List[BulkItemError] = []
+
+
+class ItemBatchRequest(BaseModel):
+    ids: List[uuid.UUID] = Field(min_length=1, max_length=settings.BATCH_MAX_IDS)
+
+
+class ItemBatchResult(BaseModel):
+    # One entry per requested id, in request order; null where none exists
+    items: List[Optional[ItemPublicWithOwner]] = []
+    not_found: List[uuid.UUID] = []
+
+
+class ItemImportError(BaseModel):
+    row: int
+    detail: Any
+
+
+class ItemImportResult(BaseModel):
+    inserted: int
+    rejected: int
+    errors: List[ItemImportError] = []
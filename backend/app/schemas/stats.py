@@ -0,0 +1,28 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from app.models.enums import ItemCategory, ItemStatus
+
+
+class ItemGroupStats(BaseModel):
+    count: int = 0
+    available: int = 0
+    available_quantity: int = 0
+
+
+class PriceBucketStats(BaseModel):
+    min_price: float
+    # None for the open-ended top bucket
+    max_price: Optional[float] = None
+    count: int = 0
+
+
+class ItemStats(BaseModel):
+    total: int
+    available: int
+    available_quantity: int
+    average_price: Optional[float] = None
+    by_category: Dict[ItemCategory, ItemGroupStats]
+    by_status: Dict[ItemStatus, ItemGroupStats]
+    price_distribution: List[PriceBucketStats]
@@ -1,3 +1,9 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+import random
+import uuid
+
 from sqlmodel import Session
 import factory
 from factory.alchemy import SQLAlchemyModelFactory
@@ -14,6 +20,14 @@ fake = Faker()
 # Create a session for factory_boy
 session = Session(engine)
 
+DEFAULT_PASSWORD = "password123"
+
+
+@lru_cache(maxsize=None)
+def default_password_hash() -> str:
+    """bcrypt is deliberately slow, so the shared seed password is hashed once."""
+    return get_password_hash(DEFAULT_PASSWORD)
+
 
 class UserFactory(SQLAlchemyModelFactory):
     class Meta:
@@ -23,8 +37,7 @@ class UserFactory(SQLAlchemyModelFactory):
 
     email = factory.Faker("email")
     full_name = factory.Faker("name")
-    hashed_password = factory.LazyFunction(
-        lambda: get_password_hash("password123"))
+    hashed_password = factory.LazyFunction(default_password_hash)
     is_active = True
     role = factory.Faker("random_element", elements=[
                          UserRole.user, UserRole.guest])
@@ -47,3 +60,78 @@ class ItemFactory(SQLAlchemyModelFactory):
                            ItemStatus.draft, ItemStatus.published, ItemStatus.archived])
     is_available = True
     owner_id = factory.SubFactory(UserFactory)
+
+
+class BulkRowFactory:
+    """Fast row generator for large seeds, written out with COPY.
+
+    Builds plain tuples instead of ORM objects and samples from a small pool of
+    Faker values, since calling Faker per field dominates at millions of rows.
+    """
+
+    USER_COLUMNS = ("id", "email", "full_name", "is_active", "role",
+                    "hashed_password", "created_at", "updated_at")
+    ITEM_COLUMNS = ("id", "title", "description", "price", "quantity", "category",
+                    "status", "is_available", "owner_id", "created_at", "updated_at")
+
+    def __init__(
+        self,
+        run_id: str,
+        password_hash: str,
+        seed: Optional[int] = None,
+        pool_size: int = 500,
+    ):
+        self.run_id = run_id
+        self.password_hash = password_hash
+        self.rng = random.Random(seed)
+        pool_fake = Faker()
+        if seed is not None:
+            pool_fake.seed_instance(seed)
+        self.names = [pool_fake.name() for _ in range(pool_size)]
+        self.titles = [pool_fake.sentence(nb_words=3) for _ in range(pool_size)]
+        self.descriptions = [
+            pool_fake.text(max_nb_chars=500) for _ in range(pool_size)]
+        self.now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def _timestamp(self) -> datetime:
+        return self.now - timedelta(seconds=self.rng.randint(0, 365 * 24 * 3600))
+
+    def user_rows(self, start: int, count: int) -> List[Tuple[Any, ...]]:
+        rows = []
+        for index in range(start, start + count):
+            created_at = self._timestamp()
+            rows.append((
+                uuid.uuid4(),
+                f"seed-{self.run_id}-{index}@example.com",
+                self.rng.choice(self.names),
+                True,
+                self.rng.choice((UserRole.user, UserRole.guest)).value,
+                self.password_hash,
+                created_at,
+                created_at,
+            ))
+        return rows
+
+    def item_rows(
+        self, owner_ids: List[uuid.UUID], per_owner: int
+    ) -> List[Tuple[Any, ...]]:
+        categories = [category.value for category in ItemCategory]
+        statuses = [status.value for status in ItemStatus]
+        rows = []
+        for owner_id in owner_ids:
+            for _ in range(per_owner):
+                created_at = self._timestamp()
+                rows.append((
+                    uuid.uuid4(),
+                    self.rng.choice(self.titles),
+                    self.rng.choice(self.descriptions),
+                    round(self.rng.uniform(1, 1000), 2),
+                    self.rng.randint(1, 100),
+                    self.rng.choice(categories),
+                    self.rng.choice(statuses),
+                    True,
+                    owner_id,
+                    created_at,
+                    created_at,
+                ))
+        return rows
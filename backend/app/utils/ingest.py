@@ -0,0 +1,89 @@
+from typing import Any, AsyncIterator, List, Optional, Tuple
+import codecs
+import csv
+import json
+
+# (1-based data row number, parsed record or the error that rejected it)
+ParsedRow = Tuple[int, Any]
+
+
+async def iter_line_batches(chunks: AsyncIterator[bytes]) -> AsyncIterator[List[str]]:
+    """Split a byte stream into batches of complete text lines.
+
+    One batch is produced per incoming chunk, so memory is bounded by the
+    chunk size rather than the size of the upload.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        if lines:
+            yield lines
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield [pending]
+
+
+async def iter_ndjson_rows(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[List[ParsedRow]]:
+    row_number = 0
+    async for lines in iter_line_batches(chunks):
+        batch: List[ParsedRow] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                record = json.loads(line)
+            except ValueError as exc:
+                batch.append((row_number, exc))
+                continue
+            if not isinstance(record, dict):
+                record = ValueError("Expected a JSON object")
+            batch.append((row_number, record))
+        yield batch
+
+
+async def iter_csv_rows(
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[List[ParsedRow]]:
+    """Parse CSV with a header row; empty cells are treated as missing."""
+    header: Optional[List[str]] = None
+    row_number = 0
+    carry: List[str] = []
+    in_quotes = False
+
+    async for lines in iter_line_batches(chunks):
+        # Only hand complete records to the csv module: a line ends a record
+        # unless it leaves a quoted field open.
+        records: List[str] = []
+        for line in lines:
+            carry.append(line)
+            if line.count('"') % 2:
+                in_quotes = not in_quotes
+            if not in_quotes:
+                records.append("\n".join(carry))
+                carry = []
+
+        batch: List[ParsedRow] = []
+        for values in csv.reader(records):
+            if not values:
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row_number += 1
+            if len(values) != len(header):
+                batch.append((row_number, ValueError(
+                    f"Expected {len(header)} columns, got {len(values)}")))
+                continue
+            batch.append((row_number, {
+                name: value
+                for name, value in zip(header, values, strict=True) if value != ""}))
+        yield batch
+
+    if carry:
+        row_number += 1
+        yield [(row_number, ValueError("Unterminated quoted field"))]
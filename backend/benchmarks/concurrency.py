@@ -0,0 +1,123 @@
+"""Concurrent-request throughput benchmark.
+
+Fires a fixed number of requests at a running API with a bounded number of
+in-flight requests and reports throughput and latency percentiles. Run it
+against two builds (e.g. before/after a change) to compare them:
+
+    python benchmarks/concurrency.py --url http://localhost:8000 \
+        --path /api/v1/items/ --concurrency 64 --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Awaitable, Callable, List, Optional
+
+import httpx
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": email, "password": password},
+    )
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+# Sends request number i; any status >= 400 counts as an error
+Send = Callable[[httpx.AsyncClient, int], Awaitable[httpx.Response]]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+        },
+    }
+
+
+async def measure(
+    client: httpx.AsyncClient, send: Send, concurrency: int, total: int
+) -> dict:
+    """Issue `total` requests with at most `concurrency` in flight."""
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await send(client, index)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(total)))
+    return summarize(latencies, errors, time.perf_counter() - started)
+
+
+async def run(
+    url: str,
+    path: str,
+    concurrency: int,
+    total: int,
+    token: Optional[str],
+) -> dict:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        cpu = time.process_time()
+        report = await measure(
+            client, lambda client, _: client.get(path, headers=headers),
+            concurrency, total)
+    # httpx costs the client about 2 ms of CPU per request. If that is a large
+    # share of elapsed_s the load generator, not the API, set the pace (and
+    # connections left idle past the server's keep-alive timeout get closed)
+    report["client_cpu_s"] = round(time.process_time() - cpu, 2)
+    return {"path": path, "concurrency": concurrency, **report}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/api/v1/items/")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--email", help="Log in first and send a bearer token")
+    parser.add_argument("--password", default="password123")
+    args = parser.parse_args()
+
+    token = None
+    if args.email:
+        async with httpx.AsyncClient(base_url=args.url) as client:
+            token = await login(client, args.email, args.password)
+
+    report = await run(args.url, args.path, args.concurrency, args.requests, token)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
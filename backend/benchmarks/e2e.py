@@ -0,0 +1,251 @@
+"""End-to-end HTTP benchmark of the API hot paths.
+
+Drives login, the item listing with every filter combination, item detail,
+/users/me, and item create/patch/publish at a fixed concurrency, and reports
+p50/p95/p99 latency and RPS per scenario as JSON. Point it at a running API
+(e.g. `make up`), or let it seed the database and start uvicorn itself:
+
+    python benchmarks/e2e.py --seed-users 10000 --items-per-user 10 \
+        --start-server --output bench.json
+
+Set RESPONSE_CACHE_BACKEND=none in the server's environment to measure the
+database paths rather than cache hits. Compare a later run against a saved
+report; the exit status is 1 if any scenario regressed past the threshold:
+
+    python benchmarks/e2e.py --start-server --baseline bench.json --threshold 0.15
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from concurrency import Send, login, measure
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+API = "/api/v1"
+PASSWORD = "password123"
+
+# One representative value per listing filter; every subset is benchmarked
+LIST_FILTERS: Dict[str, Dict[str, str]] = {
+    "status": {"status": "published"},
+    "category": {"category": "electronics"},
+    "available": {"is_available": "true"},
+    "price": {"min_price": "10", "max_price": "500"},
+    "search": {"search": "pro"},
+}
+
+
+def seed(users: int, items_per_user: int, workers: int) -> None:
+    subprocess.run(
+        [sys.executable, "scripts/seed_db.py", "--users", str(users),
+         "--items-per-user", str(items_per_user), "--workers", str(workers)],
+        cwd=BACKEND_DIR, check=True)
+
+
+def start_server(port: int, workers: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=BACKEND_DIR)
+
+
+async def wait_healthy(url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while True:
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"API at {url} did not become healthy")
+            await asyncio.sleep(0.5)
+
+
+async def create_bench_user(client: httpx.AsyncClient) -> str:
+    """Register a throwaway user so the write scenarios own their items."""
+    email = f"bench-{uuid.uuid4().hex[:12]}@example.com"
+    response = await client.post(f"{API}/users/", json={
+        "email": email, "full_name": "Benchmark User", "password": PASSWORD})
+    response.raise_for_status()
+    return email
+
+
+async def create_drafts(
+    client: httpx.AsyncClient, headers: Dict[str, str], count: int
+) -> List[str]:
+    ids: List[str] = []
+    for start in range(0, count, 1000):
+        records = [{"title": f"Benchmark draft {i}", "price": 9.99}
+                   for i in range(start, min(count, start + 1000))]
+        response = await client.post(f"{API}/items/bulk", json=records, headers=headers)
+        response.raise_for_status()
+        ids += [item["id"] for item in response.json()["items"]]
+    return ids
+
+
+def list_scenarios() -> List[Tuple[str, Dict[str, str]]]:
+    scenarios = []
+    for size in range(len(LIST_FILTERS) + 1):
+        for names in itertools.combinations(LIST_FILTERS, size):
+            params: Dict[str, str] = {}
+            for name in names:
+                params.update(LIST_FILTERS[name])
+            scenarios.append(("items:list[" + ",".join(names) + "]", params))
+    return scenarios
+
+
+async def build_scenarios(
+    client: httpx.AsyncClient, requests: int
+) -> List[Tuple[str, Send]]:
+    email = await create_bench_user(client)
+    token = await login(client, email, PASSWORD)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.get(f"{API}/items/", params={"limit": 100})
+    response.raise_for_status()
+    item_ids = [item["id"] for item in response.json()]
+    if not item_ids:
+        raise RuntimeError("No items to read; seed the database first")
+
+    # Untimed setup: publish needs a fresh draft per request, patch a target
+    drafts = await create_drafts(client, headers, requests + 1)
+    patch_target = drafts.pop()
+
+    def get(path: str, params: Optional[Dict[str, str]] = None) -> Send:
+        return lambda client, _: client.get(path, params=params, headers=headers)
+
+    scenarios: List[Tuple[str, Send]] = [
+        ("auth:login", lambda client, _: client.post(
+            f"{API}/auth/login", data={"username": email, "password": PASSWORD})),
+        ("users:me", get(f"{API}/users/me")),
+        ("items:detail", lambda client, i: client.get(
+            f"{API}/items/{item_ids[i % len(item_ids)]}", headers=headers)),
+    ]
+    scenarios += [(name, get(f"{API}/items/", params))
+                  for name, params in list_scenarios()]
+    scenarios += [
+        ("items:create", lambda client, i: client.post(
+            f"{API}/items/", json={"title": f"Benchmark item {i}", "price": 19.99},
+            headers=headers)),
+        ("items:patch", lambda client, i: client.patch(
+            f"{API}/items/{patch_target}", json={"quantity": i % 10000},
+            headers=headers)),
+        ("items:publish", lambda client, i: client.post(
+            f"{API}/items/{drafts[i]}/publish", headers=headers)),
+    ]
+    return scenarios
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[str]:
+    """Scenarios whose p95 grew, or RPS fell, by more than `threshold`."""
+    regressions = []
+    for name, current in report["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        p95, base_p95 = current["latency_ms"]["p95"], before["latency_ms"]["p95"]
+        if base_p95 and p95 > base_p95 * (1 + threshold):
+            regressions.append(
+                f"{name}: p95 {base_p95}ms -> {p95}ms (+{p95 / base_p95 - 1:.0%})")
+        if before["rps"] and current["rps"] < before["rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: rps {before['rps']} -> {current['rps']} "
+                f"({current['rps'] / before['rps'] - 1:.0%})")
+        if current["errors"] > before["errors"]:
+            regressions.append(
+                f"{name}: errors {before['errors']} -> {current['errors']}")
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=args.url, limits=limits, timeout=30
+    ) as client:
+        scenarios = await build_scenarios(client, args.requests)
+        results = {}
+        for name, send in scenarios:
+            if args.only and not any(part in name for part in args.only):
+                continue
+            if args.warmup and not name.startswith(("items:create", "items:publish")):
+                await measure(client, send, args.concurrency, args.warmup)
+            results[name] = await measure(
+                client, send, args.concurrency, args.requests)
+            print(f"{name}: {results[name]['rps']} rps, "
+                  f"p95 {results[name]['latency_ms']['p95']}ms", file=sys.stderr)
+
+    return {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Benchmark an already running API")
+    parser.add_argument("--start-server", action="store_true",
+                        help="Start uvicorn from this checkout for the run")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--server-workers", type=int, default=1)
+    parser.add_argument("--seed-users", type=int,
+                        help="Bulk-seed this many users before the run")
+    parser.add_argument("--items-per-user", type=int, default=10)
+    parser.add_argument("--seed-workers", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500,
+                        help="Timed requests per scenario")
+    parser.add_argument("--warmup", type=int, default=50,
+                        help="Untimed requests per read scenario")
+    parser.add_argument("--only", nargs="*",
+                        help="Run only scenarios whose name contains one of these")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    parser.add_argument("--baseline", help="Report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed relative regression, e.g. 0.10 for 10%%")
+    args = parser.parse_args()
+
+    if args.seed_users:
+        seed(args.seed_users, args.items_per_user, args.seed_workers)
+
+    server = None
+    if args.start_server:
+        server = start_server(args.port, args.server_workers)
+        args.url = f"http://127.0.0.1:{args.port}"
+    args.url = args.url or "http://localhost:8000"
+
+    try:
+        asyncio.run(wait_healthy(args.url))
+        report = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
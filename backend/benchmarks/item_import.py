@@ -0,0 +1,128 @@
+"""Item import throughput benchmark (rows/sec through POST /items/import).
+
+Generates synthetic rows on the fly and streams them to a running API, so the
+client never holds the whole payload in memory:
+
+    python benchmarks/item_import.py --email admin@example.com \
+        --password admin123 --rows 1000000 --format csv
+
+--compare-bulk also sends the same rows through POST /items/bulk in chunks of
+BULK_MAX_ITEMS, the fastest way to load items before the import endpoint.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List
+
+import httpx
+
+CATEGORIES = ["electronics", "clothing", "books", "food", "other"]
+STATUSES = ["draft", "published", "archived"]
+
+
+BULK_CHUNK = 1000
+
+
+def synthetic_rows(rows: int) -> Iterator[Dict[str, Any]]:
+    rng = random.Random(42)
+    for i in range(rows):
+        yield {
+            "title": f"Imported item {i}",
+            "description": "Synthetic import benchmark row " * 4,
+            "price": round(rng.uniform(1, 1000), 2),
+            "quantity": rng.randint(0, 100),
+            "category": rng.choice(CATEGORIES),
+            "status": rng.choice(STATUSES),
+            "is_available": rng.random() > 0.1,
+        }
+
+
+async def generate(
+    rows: int, data_format: str, batch: int = 5000
+) -> AsyncIterator[bytes]:
+    if data_format == "csv":
+        yield b"title,description,price,quantity,category,status,is_available\n"
+    source = synthetic_rows(rows)
+    for _ in range(0, rows, batch):
+        lines = []
+        for row in itertools.islice(source, batch):
+            if data_format == "csv":
+                lines.append(",".join(str(value).lower() if isinstance(value, bool)
+                                      else str(value) for value in row.values()))
+            else:
+                lines.append(json.dumps(row))
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def time_bulk(
+    client: httpx.AsyncClient, headers: Dict[str, str], rows: int
+) -> float:
+    source = synthetic_rows(rows)
+    started = time.perf_counter()
+    while True:
+        chunk: List[Dict[str, Any]] = list(itertools.islice(source, BULK_CHUNK))
+        if not chunk:
+            break
+        response = await client.post("/api/v1/items/bulk", json=chunk, headers=headers)
+        response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--format", choices=["csv", "ndjson"], default="csv")
+    parser.add_argument("--compare-bulk", action="store_true",
+                        help="Also time the same rows through POST /items/bulk")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    args = parser.parse_args()
+
+    async with httpx.AsyncClient(base_url=args.url, timeout=None) as client:
+        login = await client.post(
+            "/api/v1/auth/login",
+            data={"username": args.email, "password": args.password},
+        )
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        started = time.perf_counter()
+        response = await client.post(
+            "/api/v1/items/import",
+            params={"format": args.format},
+            content=generate(args.rows, args.format),
+            headers=headers,
+        )
+        elapsed = time.perf_counter() - started
+        response.raise_for_status()
+        summary = response.json()
+
+        report: Dict[str, Any] = {
+            "format": args.format,
+            "rows": args.rows,
+            "inserted": summary["inserted"],
+            "rejected": summary["rejected"],
+            "elapsed_s": round(elapsed, 3),
+            "rows_per_s": round(args.rows / elapsed, 1),
+        }
+        if args.compare_bulk:
+            elapsed = await time_bulk(client, headers, args.rows)
+            report["bulk"] = {
+                "chunk": BULK_CHUNK,
+                "elapsed_s": round(elapsed, 3),
+                "rows_per_s": round(args.rows / elapsed, 1),
+            }
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
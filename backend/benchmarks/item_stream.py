@@ -0,0 +1,128 @@
+"""Fan-out latency of the live item change feed.
+
+Opens many /items/stream subscribers, creates items one by one, and reports
+how long each created event took to reach every subscriber (p50/p95/p99
+from the create request being sent) and whether any subscriber missed one.
+Needs a migrated Postgres; point it at a running API (e.g. `make up`) or
+let it start uvicorn itself:
+
+    python benchmarks/item_stream.py --start-server --subscribers 200 --events 100
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+from concurrency import login, percentile
+from e2e import API, PASSWORD, create_bench_user, start_server, wait_healthy
+
+
+async def subscribe(
+    client: httpx.AsyncClient,
+    received: Dict[str, float],
+    connected: asyncio.Event,
+) -> None:
+    async with client.stream("GET", f"{API}/items/stream") as response:
+        response.raise_for_status()
+        buffer = ""
+        async for chunk in response.aiter_text():
+            connected.set()
+            buffer += chunk
+            while "\n\n" in buffer:
+                block, buffer = buffer.split("\n\n", 1)
+                fields = dict(line.split(": ", 1) for line in block.splitlines()
+                              if ": " in line and not line.startswith(":"))
+                if fields.get("event") == "created":
+                    item_id = json.loads(fields["data"])["id"]
+                    received.setdefault(item_id, time.perf_counter())
+
+
+async def run(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=args.subscribers + 10)
+    async with httpx.AsyncClient(
+        base_url=args.url, limits=limits, timeout=None
+    ) as client:
+        email = await create_bench_user(client)
+        headers = {"Authorization": f"Bearer {await login(client, email, PASSWORD)}"}
+
+        inboxes: List[Dict[str, float]] = [{} for _ in range(args.subscribers)]
+        ready = [asyncio.Event() for _ in range(args.subscribers)]
+        readers = [asyncio.create_task(subscribe(client, inbox, event))
+                   for inbox, event in zip(inboxes, ready, strict=True)]
+        await asyncio.wait_for(
+            asyncio.gather(*(event.wait() for event in ready)), 30)
+
+        sent: Dict[str, float] = {}
+        for index in range(args.events):
+            started = time.perf_counter()
+            response = await client.post(
+                f"{API}/items/", json={"title": f"Stream item {index}", "price": 1},
+                headers=headers)
+            response.raise_for_status()
+            sent[response.json()["id"]] = started
+            await asyncio.sleep(args.interval)
+
+        deadline = time.perf_counter() + args.drain
+        while (time.perf_counter() < deadline
+               and any(len(inbox) < len(sent) for inbox in inboxes)):
+            await asyncio.sleep(0.05)
+        for reader in readers:
+            reader.cancel()
+
+    latencies = [inbox[item_id] - started
+                 for inbox in inboxes for item_id, started in sent.items()
+                 if item_id in inbox]
+    expected = len(sent) * len(inboxes)
+    return {
+        "subscribers": args.subscribers,
+        "events": len(sent),
+        "delivered": len(latencies),
+        "missed": expected - len(latencies),
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+        },
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Benchmark an already running API")
+    parser.add_argument("--start-server", action="store_true",
+                        help="Start uvicorn from this checkout for the run")
+    parser.add_argument("--port", type=int, default=8768)
+    parser.add_argument("--subscribers", type=int, default=100)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.02,
+                        help="Seconds between item creates")
+    parser.add_argument("--drain", type=float, default=10.0,
+                        help="Seconds to wait for stragglers after the last create")
+    args = parser.parse_args()
+
+    server = None
+    if args.start_server:
+        server = start_server(args.port, 1)
+        args.url = f"http://127.0.0.1:{args.port}"
+    args.url = args.url or "http://localhost:8000"
+
+    try:
+        asyncio.run(wait_healthy(args.url))
+        report = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report, indent=2))
+    if report["missed"]:
+        print(f"{report['missed']} deliveries missed", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Per-request overhead of MetricsMiddleware.
+
+Calls a minimal FastAPI app in-process through ASGI (no sockets, no
+database), once bare and once wrapped in the metrics middleware, and reports
+the difference in microseconds per request:
+
+    python benchmarks/metrics_overhead.py --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+from fastapi import FastAPI
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.metrics import MetricsMiddleware  # noqa: E402
+
+
+def build_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/items/{item_id}")
+    async def read_item(item_id: str) -> Dict[str, Any]:
+        return {"id": item_id, "title": "Benchmark item", "price": 9.99}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def call(app: FastAPI, path: str) -> None:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path, "raw_path": path.encode(),
+        "root_path": "", "query_string": b"", "headers": [],
+        "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        pass
+
+    await app(scope, receive, send)
+
+
+async def time_app(app: FastAPI, requests: int) -> float:
+    """Mean microseconds per request."""
+    paths = [f"/api/v1/items/{i}" for i in range(100)]
+    for path in paths:  # warm up routing and the memoized metric children
+        await call(app, path)
+    start = time.perf_counter()
+    for i in range(requests):
+        await call(app, paths[i % len(paths)])
+    return (time.perf_counter() - start) / requests * 1e6
+
+
+async def run(requests: int, rounds: int) -> dict:
+    bare, instrumented = build_app(False), build_app(True)
+    bare_us: List[float] = []
+    metrics_us: List[float] = []
+    # Interleave rounds so drift (thermal, GC) affects both sides equally
+    for _ in range(rounds):
+        bare_us.append(await time_app(bare, requests))
+        metrics_us.append(await time_app(instrumented, requests))
+
+    bare_median = statistics.median(bare_us)
+    metrics_median = statistics.median(metrics_us)
+    return {
+        "requests_per_round": requests,
+        "rounds": rounds,
+        "bare_us_per_request": round(bare_median, 2),
+        "metrics_us_per_request": round(metrics_median, 2),
+        "overhead_us_per_request": round(metrics_median - bare_median, 2),
+        "overhead_pct": round((metrics_median / bare_median - 1) * 100, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.requests, args.rounds)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Connection pool saturation load test.
+
+Starts uvicorn with a deliberately small pool, then steps the number of
+in-flight item listing requests past pool_size + max_overflow. For each step
+it reports latency and RPS next to the pool metrics scraped from /metrics:
+mean checkout wait, overflow connections opened, checkout timeouts (served
+as 503) and peak connections lent out.
+
+    python benchmarks/pool_saturation.py --pool-size 2 --max-overflow 2 \
+        --pool-timeout 0.5 --steps 2 8 32 128
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Dict
+
+import httpx
+from prometheus_client.parser import text_string_to_metric_families
+
+from concurrency import measure
+from e2e import start_server, wait_healthy
+
+PATH = "/api/v1/items/"
+
+# Counter samples compared before and after each step, per pool
+POOL_COUNTERS = (
+    "db_pool_checkout_wait_seconds_sum",
+    "db_pool_checkout_wait_seconds_count",
+    "db_pool_overflow_connections_total",
+    "db_pool_checkout_timeouts_total",
+)
+
+
+async def scrape(client: httpx.AsyncClient) -> Dict[str, float]:
+    response = await client.get("/metrics")
+    response.raise_for_status()
+    return {
+        sample.name: sample.value
+        for family in text_string_to_metric_families(response.text)
+        for sample in family.samples
+        if sample.name.startswith("db_pool") and sample.labels.get("pool") == "primary"
+    }
+
+
+async def peak_checked_out(client: httpx.AsyncClient, stop: asyncio.Event) -> float:
+    peak = 0.0
+    while not stop.is_set():
+        peak = max(peak, (await scrape(client)).get("db_pool_checked_out", 0.0))
+        await asyncio.sleep(0.05)
+    return peak
+
+
+async def run(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=max(args.steps) + 1)
+    params = {"limit": args.limit}
+
+    def send(client: httpx.AsyncClient, _: int):
+        return client.get(PATH, params=params)
+
+    async with httpx.AsyncClient(
+        base_url=args.url, limits=limits, timeout=60
+    ) as client:
+        await measure(client, send, 1, 20)
+
+        steps = []
+        for concurrency in args.steps:
+            before = await scrape(client)
+            stop = asyncio.Event()
+            sampler = asyncio.create_task(peak_checked_out(client, stop))
+            result = await measure(client, send, concurrency, args.requests)
+            stop.set()
+            peak = await sampler
+            after = await scrape(client)
+
+            delta = {name: after.get(name, 0.0) - before.get(name, 0.0)
+                     for name in POOL_COUNTERS}
+            checkouts = delta["db_pool_checkout_wait_seconds_count"]
+            wait = delta["db_pool_checkout_wait_seconds_sum"]
+            result.update({
+                "concurrency": concurrency,
+                "pool": {
+                    "checkouts": int(checkouts),
+                    "mean_checkout_wait_ms": (
+                        round(wait / checkouts * 1000, 2) if checkouts else 0.0),
+                    "overflow_opened": int(delta["db_pool_overflow_connections_total"]),
+                    "timeouts": int(delta["db_pool_checkout_timeouts_total"]),
+                    "peak_checked_out": int(peak),
+                },
+            })
+            steps.append(result)
+            print(f"c={concurrency}: {result['rps']} rps, "
+                  f"p95 {result['latency_ms']['p95']}ms, "
+                  f"wait {result['pool']['mean_checkout_wait_ms']}ms, "
+                  f"timeouts {result['pool']['timeouts']}", file=sys.stderr)
+
+    return {
+        "pool_size": args.pool_size,
+        "max_overflow": args.max_overflow,
+        "pool_timeout": args.pool_timeout,
+        "steps": steps,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--max-overflow", type=int, default=2)
+    parser.add_argument("--pool-timeout", type=float, default=0.5)
+    parser.add_argument("--steps", type=int, nargs="+", default=[2, 4, 16, 64, 128],
+                        help="In-flight request counts to test")
+    parser.add_argument("--requests", type=int, default=500,
+                        help="Requests per step")
+    parser.add_argument("--limit", type=int, default=100,
+                        help="Page size of the listing, to lengthen each checkout")
+    args = parser.parse_args()
+
+    # The spawned server reads its pool configuration from the environment
+    os.environ.update({
+        "DB_POOL_SIZE": str(args.pool_size),
+        "DB_MAX_OVERFLOW": str(args.max_overflow),
+        "DB_POOL_TIMEOUT": str(args.pool_timeout),
+        "RESPONSE_CACHE_BACKEND": "none",
+        "METRICS_ENABLED": "true",
+    })
+    server = start_server(args.port, 1)
+    args.url = f"http://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(wait_healthy(args.url))
+        report = asyncio.run(run(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
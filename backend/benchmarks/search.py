@@ -0,0 +1,171 @@
+"""Item search latency benchmark: LIKE '%term%' scan vs. the GIN-indexed tsvector.
+
+Seeds a large item table directly with INSERT ... SELECT generate_series (run
+`alembic upgrade head` first), then times the query shapes GET /items/?search=
+issues. LIKE and tsvector are compared under the same newest-first ordering,
+for common words (in about one item in eight) and rare ones (a handful of
+items), along with sort=relevance as served (ranking at most
+SEARCH_RANK_CANDIDATES newest matches) and uncapped:
+
+    python benchmarks/search.py --items 300000 --runs 20
+    python benchmarks/search.py --cleanup
+"""
+import argparse
+import json
+import statistics
+import sys
+import os
+import time
+from typing import List
+
+from sqlalchemy import text
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from app.db.session import engine  # noqa: E402
+
+BENCH_EMAIL = "search-bench@example.com"
+COMMON_TERMS = ["quantum", "leather", "novel", "organic", "wireless"]
+# Every seeded title carries one code r10000..r59999
+RARE_TERMS = ["r10427", "r23981", "r35012", "r47770", "r58123"]
+
+WORDS = (
+    "ARRAY['quantum','leather','novel','organic','wireless','vintage','compact',"
+    "'deluxe','portable','classic','ultra','smart','eco','premium','basic',"
+    "'jacket','lamp','coffee','guide','speaker','charger','notebook','tea']"
+)
+
+SEED_SQL = f"""
+INSERT INTO item (id, title, description, price, quantity, category, status,
+                  is_available, owner_id, created_at, updated_at)
+SELECT gen_random_uuid(),
+       w[1 + floor(random() * 23)::int] || ' ' || w[1 + floor(random() * 23)::int]
+           || ' r' || (10000 + floor(random() * 50000)::int),
+       repeat(w[1 + floor(random() * 23)::int] || ' ', 40),
+       round((random() * 1000)::numeric, 2), 1, 'other', 'published', true,
+       :owner_id, now() - random() * interval '365 days', now()
+FROM generate_series(1, :count), (SELECT {WORDS} AS w) words
+"""
+
+NEWEST = "ORDER BY created_at DESC, id DESC LIMIT 100"
+TSQUERY = "to_tsquery('simple', :term || ':*')"
+
+LIKE_SQL = f"""
+SELECT id FROM item
+WHERE title LIKE '%' || :term || '%' OR description LIKE '%' || :term || '%'
+{NEWEST}
+"""
+
+FTS_SQL = f"""
+SELECT id FROM item WHERE search_vector @@ {TSQUERY}
+{NEWEST}
+"""
+
+RANK_SQL = f"""
+SELECT id FROM item
+WHERE id IN (SELECT id FROM item WHERE search_vector @@ {TSQUERY}
+             ORDER BY created_at DESC, id DESC LIMIT :candidates)
+ORDER BY ts_rank_cd(search_vector, {TSQUERY}) DESC, id LIMIT 100
+"""
+
+RANK_UNCAPPED_SQL = f"""
+SELECT id FROM item WHERE search_vector @@ {TSQUERY}
+ORDER BY ts_rank_cd(search_vector, {TSQUERY}) DESC, id LIMIT 100
+"""
+
+
+def seed(count: int) -> None:
+    with engine.begin() as conn:
+        owner_id = conn.execute(
+            text('SELECT id FROM "user" WHERE email = :email'),
+            {"email": BENCH_EMAIL},
+        ).scalar()
+        if owner_id is None:
+            owner_id = conn.execute(text(
+                'INSERT INTO "user" (id, email, full_name, is_active, role, '
+                "hashed_password, created_at, updated_at) VALUES "
+                "(gen_random_uuid(), :email, 'Search Bench', true, 'user', "
+                "'!', now(), now()) RETURNING id"
+            ), {"email": BENCH_EMAIL}).scalar()
+        existing = conn.execute(
+            text("SELECT count(*) FROM item WHERE owner_id = :owner_id"),
+            {"owner_id": owner_id},
+        ).scalar()
+        if existing < count:
+            print(f"Seeding {count - existing} items...", file=sys.stderr)
+            conn.execute(text(SEED_SQL),
+                         {"owner_id": owner_id, "count": count - existing})
+    with engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(
+            text("ANALYZE item"))
+
+
+def cleanup() -> None:
+    with engine.begin() as conn:
+        conn.execute(text(
+            'DELETE FROM item WHERE owner_id IN '
+            '(SELECT id FROM "user" WHERE email = :email)'), {"email": BENCH_EMAIL})
+        conn.execute(text('DELETE FROM "user" WHERE email = :email'),
+                     {"email": BENCH_EMAIL})
+
+
+def time_query(sql: str, terms: List[str], runs: int) -> List[float]:
+    samples = []
+    with engine.connect() as conn:
+        for i in range(runs):
+            params = {"term": terms[i % len(terms)],
+                      "candidates": settings.SEARCH_RANK_CANDIDATES}
+            start = time.perf_counter()
+            conn.execute(text(sql), params).all()
+            samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def summarize(samples: List[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))], 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=300_000)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--cleanup", action="store_true",
+                        help="Remove the benchmark owner and its items")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        return
+
+    seed(args.items)
+    queries = {
+        "like_newest": LIKE_SQL,
+        "tsvector_newest": FTS_SQL,
+        "tsvector_relevance": RANK_SQL,
+        "tsvector_relevance_uncapped": RANK_UNCAPPED_SQL,
+    }
+    report = {
+        "items": args.items,
+        "runs": args.runs,
+        "rank_candidates": settings.SEARCH_RANK_CANDIDATES,
+        **{
+            kind: {name: summarize(time_query(sql, terms, args.runs))
+                   for name, sql in queries.items()}
+            for kind, terms in (("common", COMMON_TERMS), ("rare", RARE_TERMS))
+        },
+    }
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
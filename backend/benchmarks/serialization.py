@@ -0,0 +1,113 @@
+"""CPU cost of rendering a 100-row item page, per serialization path.
+
+Builds in-memory Item/User ORM objects (no database) and calls small FastAPI
+apps in-process through ASGI, measuring process CPU time per request for:
+
+- response_model: the route returns ORM objects and FastAPI validates them
+  into the response model, then encodes with json.dumps (the default path)
+- orjson: the same route with ORJSONResponse as the response class
+- type_adapter: the route renders bytes with TypeAdapter.dump_json, as
+  FAST_JSON_RESPONSES=true does for the list endpoints
+
+    python benchmarks/serialization.py --rows 100 --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, List
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import TypeAdapter
+
+from metrics_overhead import call
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.response_cache import render_json  # noqa: E402
+from app.models.item import Item, ItemPublicWithOwner  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+PATH = "/api/v1/items/"
+
+
+def build_items(rows: int) -> List[Item]:
+    now = datetime.now(timezone.utc)
+    owners = [
+        User(id=uuid.uuid4(), email=f"owner{i}@example.com", full_name=f"Owner {i}",
+             hashed_password="!", created_at=now, updated_at=now)
+        for i in range(10)
+    ]
+    items = []
+    for i in range(rows):
+        item = Item(
+            id=uuid.uuid4(), title=f"Item {i}", description="A benchmark item " * 8,
+            price=19.99, quantity=i, owner_id=owners[i % 10].id,
+            created_at=now - timedelta(minutes=i), updated_at=now)
+        item.owner = owners[i % 10]
+        items.append(item)
+    return items
+
+
+def build_apps(items: List[Item]) -> dict:
+    adapter = TypeAdapter(List[ItemPublicWithOwner])
+
+    async def orm_items() -> Any:
+        return items
+
+    apps = {}
+    for name, response_class in (("response_model", JSONResponse),
+                                 ("orjson", ORJSONResponse)):
+        app = FastAPI(default_response_class=response_class)
+        app.get(PATH, response_model=List[ItemPublicWithOwner])(orm_items)
+        apps[name] = app
+
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get(PATH, response_model=List[ItemPublicWithOwner])
+    async def fast() -> Any:
+        return Response(render_json(adapter, items), media_type="application/json")
+
+    apps["type_adapter"] = app
+    return apps
+
+
+async def cpu_per_request(app: FastAPI, requests: int) -> float:
+    """Mean process CPU microseconds per request."""
+    for _ in range(20):
+        await call(app, PATH)
+    start = time.process_time()
+    for _ in range(requests):
+        await call(app, PATH)
+    return (time.process_time() - start) / requests * 1e6
+
+
+async def run(rows: int, requests: int) -> dict:
+    apps = build_apps(build_items(rows))
+    results = {name: round(await cpu_per_request(app, requests), 1)
+               for name, app in apps.items()}
+    baseline = results["response_model"]
+    return {
+        "rows": rows,
+        "requests": requests,
+        "cpu_us_per_request": results,
+        "cpu_saved_pct": {name: round((1 - value / baseline) * 100, 1)
+                          for name, value in results.items()},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.rows, args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
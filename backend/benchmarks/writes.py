@@ -0,0 +1,139 @@
+"""Per-write latency of the single-item write endpoints.
+
+Times item create, patch and publish and the user profile patch, one request
+at a time by default so latency reflects database round-trips rather than
+queueing. Reports p50/p95/p99 per endpoint together with the SQL statements
+each request issued (from the Server-Timing header added by the query-stats
+middleware). Save a report on one build and compare on another:
+
+    python benchmarks/writes.py --start-server --output before.json
+    python benchmarks/writes.py --start-server --baseline before.json
+"""
+import argparse
+import asyncio
+import json
+import re
+import sys
+from typing import Dict, List, Tuple
+
+import httpx
+
+from concurrency import Send, login, measure
+from e2e import (
+    API,
+    PASSWORD,
+    compare,
+    create_bench_user,
+    create_drafts,
+    start_server,
+    wait_healthy,
+)
+
+STATEMENTS = re.compile(r'desc="(\d+) statements"')
+
+
+def count_statements(send: Send, counts: List[int]) -> Send:
+    async def wrapped(client: httpx.AsyncClient, index: int) -> httpx.Response:
+        response = await send(client, index)
+        match = STATEMENTS.search(response.headers.get("server-timing", ""))
+        if match:
+            counts.append(int(match.group(1)))
+        return response
+    return wrapped
+
+
+async def build_scenarios(
+    client: httpx.AsyncClient, requests: int
+) -> List[Tuple[str, Send]]:
+    email = await create_bench_user(client)
+    token = await login(client, email, PASSWORD)
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get(f"{API}/users/me", headers=headers)).json()["id"]
+
+    # Untimed setup: publish needs a fresh draft per request, patch a target
+    drafts = await create_drafts(client, headers, requests + 1)
+    patch_target = drafts.pop()
+
+    return [
+        ("items:create", lambda client, i: client.post(
+            f"{API}/items/", json={"title": f"Benchmark item {i}", "price": 19.99},
+            headers=headers)),
+        ("items:patch", lambda client, i: client.patch(
+            f"{API}/items/{patch_target}", json={"quantity": i % 10000},
+            headers=headers)),
+        ("items:publish", lambda client, i: client.post(
+            f"{API}/items/{drafts[i]}/publish", headers=headers)),
+        ("users:patch", lambda client, i: client.patch(
+            f"{API}/users/{user_id}", json={"full_name": f"Benchmark User {i}"},
+            headers=headers)),
+    ]
+
+
+async def run(args: argparse.Namespace) -> dict:
+    async with httpx.AsyncClient(base_url=args.url, timeout=30) as client:
+        scenarios = await build_scenarios(client, args.requests)
+        results: Dict[str, dict] = {}
+        for name, send in scenarios:
+            counts: List[int] = []
+            result = await measure(
+                client, count_statements(send, counts), args.concurrency,
+                args.requests)
+            result["statements"] = (
+                round(sum(counts) / len(counts), 2) if counts else None)
+            results[name] = result
+            print(f"{name}: p50 {result['latency_ms']['p50']}ms, "
+                  f"p95 {result['latency_ms']['p95']}ms, "
+                  f"{result['statements']} statements", file=sys.stderr)
+
+    return {
+        "url": args.url,
+        "concurrency": args.concurrency,
+        "requests": args.requests,
+        "scenarios": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="Benchmark an already running API")
+    parser.add_argument("--start-server", action="store_true",
+                        help="Start uvicorn from this checkout for the run")
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--requests", type=int, default=300,
+                        help="Timed requests per endpoint")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    parser.add_argument("--baseline", help="Report to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Allowed relative regression, e.g. 0.10 for 10%%")
+    args = parser.parse_args()
+
+    server = None
+    if args.start_server:
+        server = start_server(args.port, 1)
+        args.url = f"http://127.0.0.1:{args.port}"
+    args.url = args.url or "http://localhost:8000"
+
+    try:
+        asyncio.run(wait_healthy(args.url))
+        report = asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Verify or rebuild the trigger-maintained item_stats summary table.
+
+    python scripts/item_stats.py            # report drift, exit 1 if any
+    python scripts/item_stats.py --rebuild  # recompute from the item table
+"""
+from app.db.session import engine
+from app.models.item import ITEM_PRICE_BUCKETS
+from sqlalchemy import text
+import argparse
+import sys
+import os
+
+# Add the project root to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PRICE_BUCKET = (
+    f"width_bucket(price, ARRAY[{', '.join(map(str, ITEM_PRICE_BUCKETS))}]::float8[])")
+
+STATS_COLUMNS = ("item_count", "available_count", "available_quantity", "price_sum")
+
+FRESH_SQL = f"""
+SELECT category, status, {PRICE_BUCKET} AS price_bucket,
+       count(*) AS item_count,
+       count(*) FILTER (WHERE is_available) AS available_count,
+       coalesce(sum(quantity) FILTER (WHERE is_available), 0) AS available_quantity,
+       coalesce(sum(price::numeric), 0) AS price_sum
+FROM item
+GROUP BY 1, 2, 3
+"""
+
+# Keys whose stored and recomputed totals differ; all-zero rows left behind
+# by deletes count as absent.
+DRIFT_SQL = f"""
+WITH fresh AS ({FRESH_SQL}),
+stored AS (
+    SELECT * FROM item_stats
+    WHERE (item_count, available_count, available_quantity, price_sum)
+          <> (0, 0, 0, 0)
+)
+SELECT coalesce(fresh.category, stored.category) AS category,
+       coalesce(fresh.status, stored.status) AS status,
+       coalesce(fresh.price_bucket, stored.price_bucket) AS price_bucket,
+       {", ".join(f"stored.{name} AS stored_{name}, fresh.{name} AS {name}"
+                  for name in STATS_COLUMNS)}
+FROM fresh
+FULL JOIN stored USING (category, status, price_bucket)
+WHERE {" OR ".join(f"stored.{name} IS DISTINCT FROM fresh.{name}"
+                   for name in STATS_COLUMNS)}
+ORDER BY 1, 2, 3
+"""
+
+
+def check() -> int:
+    with engine.connect() as conn:
+        drift = conn.execute(text(DRIFT_SQL)).mappings().all()
+    for row in drift:
+        changes = ", ".join(
+            f"{name} {row[f'stored_{name}']} != {row[name]}"
+            for name in STATS_COLUMNS if row[f"stored_{name}"] != row[name])
+        print(f"{row['category']}/{row['status']}/bucket {row['price_bucket']}: "
+              f"{changes}")
+    print(f"{len(drift)} drifted item_stats row(s)")
+    return len(drift)
+
+
+def rebuild() -> None:
+    with engine.begin() as conn:
+        # Writers wait until the totals are consistent again
+        conn.execute(text("LOCK TABLE item IN SHARE MODE"))
+        conn.execute(text("DELETE FROM item_stats"))
+        conn.execute(text(
+            "INSERT INTO item_stats (category, status, price_bucket, item_count, "
+            "available_count, available_quantity, price_sum) " + FRESH_SQL))
+    print("item_stats rebuilt")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check or rebuild item_stats.")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="Recompute item_stats from the item table")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        rebuild()
+    elif check():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,23 @@
-from app.utils.factories import UserFactory, ItemFactory
+from app.utils.factories import (
+    DEFAULT_PASSWORD,
+    BulkRowFactory,
+    ItemFactory,
+    UserFactory,
+    default_password_hash,
+)
 from app.models.item import Item
 from app.models.user import User
 from app.models.enums import UserRole
 from app.db.session import engine
 from app.core.security import get_password_hash
 from sqlmodel import Session, SQLModel, select
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Tuple
+import argparse
+import csv
+import io
+import time
+import uuid
 import sys
 import os
 
@@ -61,5 +74,102 @@ def seed_database():
         print("Database seeding completed!")
 
 
+# (first user index, user count, items per user, run id, password hash)
+BulkTask = Tuple[int, int, int, str, str]
+
+
+def copy_rows(cursor, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor.copy_expert(
+        f'COPY "{table}" ({", ".join(columns)}) FROM STDIN WITH (FORMAT csv)', buffer)
+
+
+def seed_batch(task: BulkTask) -> int:
+    """Insert one batch of users and their items; committed as one transaction."""
+    start, count, items_per_user, run_id, password_hash = task
+    rows = BulkRowFactory(run_id, password_hash, seed=start)
+    users = rows.user_rows(start, count)
+    items = rows.item_rows([user[0] for user in users], items_per_user)
+
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        copy_rows(cursor, "user", BulkRowFactory.USER_COLUMNS, users)
+        copy_rows(cursor, "item", BulkRowFactory.ITEM_COLUMNS, items)
+        connection.commit()
+    finally:
+        connection.close()
+    return len(users) + len(items)
+
+
+def init_worker() -> None:
+    # Connections inherited from the parent process must not be shared
+    engine.dispose(close=False)
+
+
+def bulk_tasks(
+    users: int, items_per_user: int, batch_size: int, password_hash: str
+) -> Iterator[BulkTask]:
+    run_id = uuid.uuid4().hex[:8]
+    # Size each batch so it holds roughly batch_size rows in total
+    users_per_batch = max(1, batch_size // (items_per_user + 1))
+    for start in range(0, users, users_per_batch):
+        count = min(users_per_batch, users - start)
+        yield start, count, items_per_user, run_id, password_hash
+
+
+def bulk_seed(users: int, items_per_user: int, batch_size: int, workers: int) -> None:
+    """Seed users x items_per_user rows with COPY, committing per batch."""
+    SQLModel.metadata.create_all(engine)
+
+    password_hash = default_password_hash()
+    total = users * (items_per_user + 1)
+    tasks = bulk_tasks(users, items_per_user, batch_size, password_hash)
+    print(f"Seeding {users} users and {users * items_per_user} items "
+          f"(batch size {batch_size}, {workers} worker(s))...")
+
+    done = 0
+    started = time.perf_counter()
+
+    def report(inserted: int) -> None:
+        nonlocal done
+        done += inserted
+        elapsed = time.perf_counter() - started
+        print(f"  {done}/{total} rows ({done / total:.0%}), "
+              f"{done / elapsed:,.0f} rows/s", flush=True)
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+            for inserted in pool.map(seed_batch, tasks):
+                report(inserted)
+    else:
+        for task in tasks:
+            report(seed_batch(task))
+
+    elapsed = time.perf_counter() - started
+    print(f"Bulk seeding completed: {done} rows in {elapsed:.1f}s "
+          f"({done / elapsed:,.0f} rows/s). Password for all users: "
+          f"{DEFAULT_PASSWORD}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the database.")
+    parser.add_argument("--users", type=int,
+                        help="Bulk mode: number of users to generate")
+    parser.add_argument("--items-per-user", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="Rows per COPY batch and transaction")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Generate and load batches in parallel processes")
+    args = parser.parse_args()
+
+    if args.users:
+        bulk_seed(args.users, args.items_per_user, args.batch_size, args.workers)
+    else:
+        seed_database()
+
+
 if __name__ == "__main__":
-    seed_database()
+    main()
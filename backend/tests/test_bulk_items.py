@@ -0,0 +1,116 @@
+"""Bulk item endpoints apply what they can and report the rest per index."""
+from typing import Any, Dict, List
+import uuid
+
+import httpx
+
+from app.models.user import User
+from tests.conftest import PRICE, MakeUser, auth_headers
+
+
+async def owned_item_ids(client: httpx.AsyncClient, owner: User) -> List[str]:
+    response = await client.get("/api/v1/items/my", headers=auth_headers(owner))
+    return [item["id"] for item in response.json()]
+
+
+def error_map(result: Dict[str, Any]) -> Dict[int, int]:
+    return {error["index"]: error["status_code"] for error in result["errors"]}
+
+
+async def test_bulk_create_skips_invalid_records(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    owner = await make_user()
+    records = [
+        {"title": "Good one", "price": 1},
+        {"title": "Negative", "price": -1},
+        {"price": 2},
+        {"title": "Good two", "price": 3},
+    ]
+    response = await client.post(
+        "/api/v1/items/bulk", json=records, headers=auth_headers(owner))
+
+    assert response.status_code == 200
+    result = response.json()
+    assert [item["title"] for item in result["items"]] == ["Good one", "Good two"]
+    assert error_map(result) == {1: 422, 2: 422}
+    assert len(await owned_item_ids(client, owner)) == 2
+
+
+async def test_bulk_update_applies_valid_records_only(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    owner, stranger = await make_user(items=4), await make_user(items=1)
+    mine = await owned_item_ids(client, owner)
+    theirs = await owned_item_ids(client, stranger)
+    records = [
+        {"id": mine[0], "title": "Renamed"},
+        {"id": mine[1], "price": 5, "quantity": 7},
+        {"title": "No id"},
+        {"id": mine[2], "price": -3},
+        {"id": mine[2], "title": None},
+        {"id": theirs[0], "title": "Not mine"},
+        {"id": str(uuid.uuid4()), "title": "Missing"},
+        {"id": mine[3]},
+        {"id": mine[0], "quantity": 1},
+    ]
+    response = await client.patch(
+        "/api/v1/items/bulk", json=records, headers=auth_headers(owner))
+
+    assert response.status_code == 200
+    result = response.json()
+    # mine[0] and mine[2] are repeated, so none of their records apply
+    assert error_map(result) == {
+        0: 422, 2: 422, 3: 422, 4: 422, 5: 403, 6: 404, 7: 422, 8: 422}
+    assert "repeated" in result["errors"][0]["detail"]
+
+    updated = {item["id"]: item for item in result["items"]}
+    assert list(updated) == [mine[1]]
+    assert (updated[mine[1]]["price"], updated[mine[1]]["quantity"]) == (5, 7)
+
+    detail = (await client.get(f"/api/v1/items/{mine[0]}")).json()
+    assert detail["title"].startswith("Test item")
+    assert detail["price"] == PRICE
+    theirs_detail = (await client.get(f"/api/v1/items/{theirs[0]}")).json()
+    assert theirs_detail["title"].startswith("Test item")
+
+
+async def test_bulk_update_groups_records_by_columns(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    owner = await make_user(items=3)
+    mine = await owned_item_ids(client, owner)
+    records = [
+        {"id": mine[0], "title": "A"},
+        {"id": mine[1], "price": 2.5},
+        {"id": mine[2], "title": "C"},
+    ]
+    response = await client.patch(
+        "/api/v1/items/bulk", json=records, headers=auth_headers(owner))
+
+    result = response.json()
+    assert result["errors"] == []
+    updated = {item["id"]: item for item in result["items"]}
+    assert updated[mine[0]]["title"] == "A"
+    assert updated[mine[1]]["price"] == 2.5
+    assert updated[mine[2]]["title"] == "C"
+
+
+async def test_bulk_delete_removes_only_permitted_items(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    owner, stranger = await make_user(items=2), await make_user(items=1)
+    mine = await owned_item_ids(client, owner)
+    theirs = await owned_item_ids(client, stranger)
+    missing = str(uuid.uuid4())
+
+    response = await client.request(
+        "DELETE", "/api/v1/items/bulk", json={"ids": [*mine, theirs[0], missing]},
+        headers=auth_headers(owner))
+
+    assert response.status_code == 200
+    result = response.json()
+    assert sorted(result["deleted"]) == sorted(mine)
+    assert error_map(result) == {2: 403, 3: 404}
+    assert await owned_item_ids(client, owner) == []
+    assert await owned_item_ids(client, stranger) == theirs
@@ -0,0 +1,106 @@
+"""Conditional GETs and writes on items: If-None-Match, If-Modified-Since, If-Match."""
+from datetime import timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List
+
+import httpx
+import pytest
+
+from app.models.user import User
+from tests.conftest import PRICE, auth_headers
+
+
+@pytest.fixture
+async def item(client: httpx.AsyncClient, owners: List[User]) -> Dict:
+    owner_id = str(owners[0].id)
+    items = (await client.get(
+        "/api/v1/items/", params={"min_price": PRICE, "max_price": PRICE})).json()
+    return next(entry for entry in items if entry["owner_id"] == owner_id)
+
+
+async def test_if_none_match_answers_304(client: httpx.AsyncClient, item: Dict) -> None:
+    path = f"/api/v1/items/{item['id']}"
+    etag = (await client.get(path)).headers["etag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = await client.get(path, headers={"If-None-Match": header})
+        assert response.status_code == 304, header
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+    response = await client.get(path, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+async def test_if_none_match_takes_precedence_over_if_modified_since(
+    client: httpx.AsyncClient, item: Dict
+) -> None:
+    path = f"/api/v1/items/{item['id']}"
+    last_modified = (await client.get(path)).headers["last-modified"]
+
+    response = await client.get(path, headers={
+        "If-None-Match": '"other"', "If-Modified-Since": last_modified})
+    assert response.status_code == 200
+
+
+async def test_if_modified_since(client: httpx.AsyncClient, item: Dict) -> None:
+    path = f"/api/v1/items/{item['id']}"
+    last_modified = (await client.get(path)).headers["last-modified"]
+    earlier = format_datetime(
+        parsedate_to_datetime(last_modified) - timedelta(seconds=1), usegmt=True)
+
+    assert (await client.get(
+        path, headers={"If-Modified-Since": last_modified})).status_code == 304
+    assert (await client.get(
+        path, headers={"If-Modified-Since": earlier})).status_code == 200
+    # A date that cannot be parsed is ignored
+    assert (await client.get(
+        path, headers={"If-Modified-Since": "yesterday"})).status_code == 200
+
+
+async def test_list_if_none_match(
+    client: httpx.AsyncClient, owners: List[User]
+) -> None:
+    params = {"min_price": PRICE, "max_price": PRICE, "limit": 5}
+    etag = (await client.get("/api/v1/items/", params=params)).headers["etag"]
+
+    response = await client.get(
+        "/api/v1/items/", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Another page has another validator
+    response = await client.get(
+        "/api/v1/items/", params={**params, "limit": 4},
+        headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+async def test_if_match_rejects_a_stale_write(
+    client: httpx.AsyncClient, owners: List[User], item: Dict
+) -> None:
+    path = f"/api/v1/items/{item['id']}"
+    headers = auth_headers(owners[0])
+    etag = (await client.get(path)).headers["etag"]
+
+    first = await client.patch(
+        path, json={"title": "First"}, headers={**headers, "If-Match": etag})
+    assert first.status_code == 200
+    second = await client.patch(
+        path, json={"title": "Second"}, headers={**headers, "If-Match": etag})
+    assert second.status_code == 412
+
+    assert (await client.get(path)).json()["title"] == "First"
+
+
+async def test_patch_etag_matches_the_next_get(
+    client: httpx.AsyncClient, owners: List[User], item: Dict
+) -> None:
+    path = f"/api/v1/items/{item['id']}"
+    response = await client.patch(
+        path, json={"title": "Renamed"}, headers=auth_headers(owners[0]))
+    assert response.status_code == 200
+
+    etag = response.headers["etag"]
+    assert (await client.get(path)).headers["etag"] == etag
+    response = await client.get(path, headers={"If-None-Match": etag})
+    assert response.status_code == 304
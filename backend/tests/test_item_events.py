@@ -0,0 +1,122 @@
+"""Item change feed: replay by Last-Event-ID, resync and slow subscribers."""
+from typing import List, Optional
+import asyncio
+import json
+
+import httpx
+import psycopg
+import pytest
+
+from app.core.config import settings
+from app.core.item_events import RESYNC, ItemEvent, ItemEventBroker, Subscription
+from app.models.user import User
+from tests.conftest import MakeUser
+
+
+def event(event_id: int, status: str = "published", **data) -> ItemEvent:
+    data = {"id": str(event_id), "status": status, **data}
+    return ItemEvent(event_id, "update", data)
+
+
+def pending_ids(subscription: Subscription) -> List[Optional[int]]:
+    return [pending.id for pending in subscription.pending]
+
+
+@pytest.fixture
+def broker() -> ItemEventBroker:
+    broker = ItemEventBroker(replay_size=3, subscriber_buffer=10)
+    for event_id in range(1, 6):
+        broker.publish(event(event_id))
+    return broker
+
+
+def test_last_event_id_replays_what_was_missed(broker: ItemEventBroker) -> None:
+    subscription = broker.subscribe(None, None, last_event_id=3)
+    assert pending_ids(subscription) == [4, 5]
+
+    broker.publish(event(6))
+    assert pending_ids(subscription) == [4, 5, 6]
+
+
+def test_expired_last_event_id_asks_for_a_resync(broker: ItemEventBroker) -> None:
+    # Only events 3-5 are still buffered
+    subscription = broker.subscribe(None, None, last_event_id=1)
+    assert [pending.op for pending in subscription.pending] == [RESYNC]
+    assert subscription.pending[0].data == {"reason": "expired"}
+
+
+def test_filters_match_the_previous_value(broker: ItemEventBroker) -> None:
+    subscription = broker.subscribe(None, frozenset({"published"}), None)
+    broker.publish(event(6, status="draft"))
+    broker.publish(event(7, status="archived", previous_status="published"))
+    broker.publish(ItemEvent(None, RESYNC, {"reason": "reconnected"}))
+    assert pending_ids(subscription) == [7, None]
+
+
+def test_slow_subscriber_is_closed_instead_of_buffering() -> None:
+    broker = ItemEventBroker(replay_size=3, subscriber_buffer=2)
+    subscription = broker.subscribe(None, None, None)
+    for event_id in range(1, 4):
+        broker.publish(event(event_id))
+    assert subscription.closed
+    assert pending_ids(subscription) == [1, 2]
+
+
+def test_malformed_notification_is_skipped(broker: ItemEventBroker) -> None:
+    subscription = broker.subscribe(None, None, None)
+    broker._receive("not json")
+    broker._receive('{"op": "update"}')
+    broker._receive('{"event_id": 9, "op": "delete", "id": "x"}')
+    assert pending_ids(subscription) == [9]
+
+
+async def test_stream_sends_events_heartbeats_and_ends_when_closed(
+    broker: ItemEventBroker,
+) -> None:
+    body = broker.stream(None, None, last_event_id=4, heartbeat=0.01)
+    assert await anext(body) == b"retry: 3000\n\n"
+    assert (await anext(body)).startswith(b"id: 5\nevent: update\ndata: ")
+    assert await anext(body) == b": heartbeat\n\n"
+
+    (subscription,) = broker.subscriptions
+    broker.publish(event(6))
+    assert (await anext(body)).startswith(b"id: 6\n")
+
+    subscription.closed = True
+    subscription.ready.set()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(anext(body), 1)
+    assert not broker.subscriptions
+
+
+async def test_stream_endpoint_is_404_when_disabled(client: httpx.AsyncClient) -> None:
+    # conftest turns the feed off
+    response = await client.get("/api/v1/items/stream")
+    assert response.status_code == 404
+
+
+async def notified_ops(owner: User, options: str) -> List[str]:
+    """Ops LISTEN receives for an update of owner's items on a new connection."""
+    async with await psycopg.AsyncConnection.connect(
+        settings.DATABASE_URL, autocommit=True
+    ) as listener:
+        await listener.execute("LISTEN item_events")
+        async with await psycopg.AsyncConnection.connect(
+            settings.DATABASE_URL, options=options, autocommit=True
+        ) as writer:
+            await writer.execute(
+                "UPDATE item SET quantity = quantity WHERE owner_id = %s", (owner.id,))
+        return [json.loads(notify.payload)["op"]
+                async for notify in listener.notifies(timeout=0.5)]
+
+
+@pytest.mark.parametrize(("options", "expected"), [
+    ("", []),
+    ("-c app.item_events=off", []),
+    ("-c app.item_events=on", ["updated"]),
+])
+async def test_triggers_notify_only_sessions_that_opt_in(
+    make_user: MakeUser, options: str, expected: List[str]
+) -> None:
+    owner = await make_user(items=1)
+    assert await notified_ops(owner, options) == expected
@@ -0,0 +1,103 @@
+"""/items/stats is served from item_stats, which triggers keep in step with item."""
+from typing import Any, Dict
+
+import httpx
+from sqlalchemy import text
+
+from app.db.session import AsyncSessionLocal
+from tests.conftest import MakeUser, auth_headers
+
+TOTALS_SQL = text("""
+SELECT count(*), count(*) FILTER (WHERE is_available),
+       coalesce(sum(quantity) FILTER (WHERE is_available), 0)
+FROM item
+""")
+
+
+async def stats(client: httpx.AsyncClient) -> Dict[str, Any]:
+    response = await client.get("/api/v1/items/stats")
+    assert response.status_code == 200
+    return response.json()
+
+
+def bucket_counts(result: Dict[str, Any]) -> list:
+    return [bucket["count"] for bucket in result["price_distribution"]]
+
+
+async def test_stats_match_the_item_table(client: httpx.AsyncClient) -> None:
+    result = await stats(client)
+    async with AsyncSessionLocal() as db:
+        total, available, quantity = (await db.exec(TOTALS_SQL)).one()
+
+    assert (result["total"], result["available"], result["available_quantity"]) == (
+        total, available, quantity)
+    assert sum(group["count"] for group in result["by_category"].values()) == total
+    assert sum(bucket_counts(result)) == total
+
+
+async def test_writes_move_items_between_groups(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    headers = auth_headers(await make_user())
+    before = await stats(client)
+
+    response = await client.post("/api/v1/items/", headers=headers, json={
+        "title": "Stats lamp", "price": 75, "quantity": 3, "category": "books",
+        "status": "draft", "is_available": True})
+    assert response.status_code == 200
+    item_id = response.json()["id"]
+
+    created = await stats(client)
+    assert created["total"] == before["total"] + 1
+    assert created["available_quantity"] == before["available_quantity"] + 3
+    books = created["by_category"]["books"]
+    assert books["count"] == before["by_category"]["books"]["count"] + 1
+    assert books["available"] == before["by_category"]["books"]["available"] + 1
+    assert created["by_status"]["draft"]["count"] == (
+        before["by_status"]["draft"]["count"] + 1)
+    # 75 falls in the [50, 100) bucket
+    expected = bucket_counts(before)
+    expected[2] += 1
+    assert bucket_counts(created) == expected
+
+    response = await client.patch(f"/api/v1/items/{item_id}", headers=headers, json={
+        "price": 600, "category": "food", "is_available": False})
+    assert response.status_code == 200
+
+    moved = await stats(client)
+    assert moved["total"] == created["total"]
+    assert moved["available"] == before["available"]
+    assert moved["available_quantity"] == before["available_quantity"]
+    assert moved["by_category"]["books"] == before["by_category"]["books"]
+    food = moved["by_category"]["food"]
+    assert food["count"] == before["by_category"]["food"]["count"] + 1
+    assert food["available"] == before["by_category"]["food"]["available"]
+    expected = bucket_counts(before)
+    expected[4] += 1
+    assert bucket_counts(moved) == expected
+
+    response = await client.delete(f"/api/v1/items/{item_id}", headers=headers)
+    assert response.status_code == 200
+    assert await stats(client) == before
+
+
+async def test_bulk_writes_are_counted(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    headers = auth_headers(await make_user())
+    before = await stats(client)
+
+    records = [{"title": f"Stats bulk {index}", "price": 5, "quantity": 1}
+               for index in range(3)]
+    response = await client.post("/api/v1/items/bulk", json=records, headers=headers)
+    ids = [item["id"] for item in response.json()["items"]]
+    assert len(ids) == 3
+
+    created = await stats(client)
+    assert created["total"] == before["total"] + 3
+    assert bucket_counts(created)[0] == bucket_counts(before)[0] + 3
+
+    response = await client.request(
+        "DELETE", "/api/v1/items/bulk", json={"ids": ids}, headers=headers)
+    assert response.status_code == 200
+    assert await stats(client) == before
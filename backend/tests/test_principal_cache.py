@@ -0,0 +1,53 @@
+"""The cached principal must follow changes to the user row."""
+import httpx
+
+from app.api.deps import principal_cache
+from app.models.user import UserRole
+from tests.conftest import MakeUser, auth_headers
+
+
+async def test_deactivation_takes_effect_immediately(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    admin, user = await make_user(role=UserRole.admin), await make_user()
+    headers = auth_headers(user)
+    assert (await client.get("/api/v1/items/my", headers=headers)).status_code == 200
+    assert principal_cache.get(user.id) is not None
+
+    response = await client.patch(
+        f"/api/v1/users/{user.id}", json={"is_active": False},
+        headers=auth_headers(admin))
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/items/my", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+
+async def test_role_change_takes_effect_immediately(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    admin, user = await make_user(role=UserRole.admin), await make_user()
+    headers = auth_headers(user)
+    assert (await client.get("/api/v1/users/", headers=headers)).status_code == 403
+
+    response = await client.patch(
+        f"/api/v1/users/{user.id}", json={"role": "admin"},
+        headers=auth_headers(admin))
+    assert response.status_code == 200
+
+    assert (await client.get("/api/v1/users/", headers=headers)).status_code == 200
+
+
+async def test_deleted_user_is_rejected(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    admin, user = await make_user(role=UserRole.admin), await make_user()
+    headers = auth_headers(user)
+    assert (await client.get("/api/v1/items/my", headers=headers)).status_code == 200
+
+    response = await client.delete(
+        f"/api/v1/users/{user.id}", headers=auth_headers(admin))
+    assert response.status_code == 200
+
+    assert (await client.get("/api/v1/items/my", headers=headers)).status_code == 401
@@ -0,0 +1,58 @@
+"""Statement-count regression tests for the item read endpoints.
+
+Counts come from the Server-Timing header set by the query-stats middleware.
+A bound that holds for any page size catches per-row lazy loads (N+1) on
+relationships that ``lazy="raise_on_sql"`` does not guard.
+"""
+import re
+from typing import List
+
+import httpx
+
+from app.models.user import User
+from tests.conftest import PRICE
+
+STATEMENTS = re.compile(r'desc="(\d+) statements"')
+
+# Page query plus one IN query for the owners
+MAX_LIST_STATEMENTS = 2
+# Item joined with its owner
+MAX_DETAIL_STATEMENTS = 1
+
+
+def statement_count(response: httpx.Response) -> int:
+    match = STATEMENTS.search(response.headers.get("server-timing", ""))
+    assert match, "Server-Timing carries no statement count"
+    return int(match.group(1))
+
+
+async def test_item_list_statement_count_is_bounded(
+    client: httpx.AsyncClient, owners: List[User]
+) -> None:
+    counts = {}
+    for limit in (1, 20):
+        response = await client.get(
+            "/api/v1/items/",
+            params={"min_price": PRICE, "max_price": PRICE, "limit": limit})
+        assert response.status_code == 200
+        items = response.json()
+        assert len(items) == limit
+        assert all(item["owner"] is not None for item in items)
+        counts[limit] = statement_count(response)
+
+    # 20 items across five owners cost no more than a single item
+    assert counts[20] == counts[1]
+    assert counts[20] <= MAX_LIST_STATEMENTS
+
+
+async def test_item_detail_statement_count_is_bounded(
+    client: httpx.AsyncClient, owners: List[User]
+) -> None:
+    listing = await client.get(
+        "/api/v1/items/", params={"min_price": PRICE, "max_price": PRICE})
+    item = listing.json()[0]
+
+    response = await client.get(f"/api/v1/items/{item['id']}")
+    assert response.status_code == 200
+    assert response.json()["owner"]["id"] == item["owner_id"]
+    assert statement_count(response) <= MAX_DETAIL_STATEMENTS
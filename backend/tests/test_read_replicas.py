@@ -0,0 +1,80 @@
+"""Replica selection for read-only handlers: fallback and read-your-writes."""
+from typing import AsyncIterator, Optional
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.session import ReadReplicas, read_session, recent_writers
+from tests.conftest import MakeUser, auth_headers
+
+# Nothing listens on port 1, so connecting fails at once
+UNREACHABLE = "postgresql+psycopg://postgres@127.0.0.1:1/fastapi_db"
+
+
+def read_sessions(target: str) -> float:
+    value: Optional[float] = REGISTRY.get_sample_value(
+        "db_read_sessions_total", {"target": target})
+    return value or 0.0
+
+
+@pytest.fixture
+async def replicas(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[ReadReplicas]:
+    """An unreachable replica and a healthy one (the primary, under another name)."""
+    replicas = ReadReplicas(
+        [UNREACHABLE, settings.ASYNC_DATABASE_URL], "round_robin", retry_seconds=60)
+    monkeypatch.setattr(db_session, "read_replicas", replicas)
+    yield replicas
+    await replicas.dispose()
+
+
+async def test_unreachable_replica_is_skipped_and_retried_later(
+    replicas: ReadReplicas,
+) -> None:
+    for _ in range(3):
+        session = await replicas.session()
+        assert session is not None
+        async with session:
+            assert (await session.exec(text("SELECT 1"))).scalar() == 1
+    assert replicas.candidates() == [1]
+
+    # Once the retry interval passes the replica is tried again
+    replicas._unhealthy_until[0] = 0.0
+    assert sorted(replicas.candidates()) == [0, 1]
+
+
+async def test_reads_fall_back_to_the_primary(monkeypatch: pytest.MonkeyPatch) -> None:
+    replicas = ReadReplicas([UNREACHABLE], "round_robin", retry_seconds=60)
+    monkeypatch.setattr(db_session, "read_replicas", replicas)
+    primary = read_sessions("primary")
+    try:
+        async with read_session() as session:
+            assert (await session.exec(text("SELECT 1"))).scalar() == 1
+    finally:
+        await replicas.dispose()
+    assert read_sessions("primary") == primary + 1
+    assert replicas.candidates() == []
+
+
+async def test_client_reads_its_own_writes_from_the_primary(
+    client: httpx.AsyncClient, make_user: MakeUser, replicas: ReadReplicas
+) -> None:
+    writer, reader = auth_headers(await make_user()), auth_headers(await make_user())
+    # Only the healthy replica is in rotation
+    replicas.mark_unhealthy(0)
+
+    response = await client.post(
+        "/api/v1/items/", json={"title": "Fresh", "price": 1}, headers=writer)
+    assert response.status_code == 200
+    assert recent_writers.get(writer["Authorization"])
+
+    primary, replica = read_sessions("primary"), read_sessions("replica1")
+    assert (await client.get("/api/v1/items/my", headers=writer)).status_code == 200
+    assert read_sessions("primary") == primary + 1
+
+    # A client without recent writes is served by the replica
+    assert (await client.get("/api/v1/items/my", headers=reader)).status_code == 200
+    assert read_sessions("replica1") == replica + 1
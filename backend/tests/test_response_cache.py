@@ -0,0 +1,90 @@
+"""Versioned invalidation of the item response cache."""
+from typing import AsyncIterator, List
+import uuid
+
+import httpx
+import pytest
+
+from app.core.response_cache import (
+    CachedResponse,
+    MemoryCacheBackend,
+    ResponseCache,
+    item_response_cache,
+)
+from app.models.user import User
+from tests.conftest import PRICE, auth_headers
+
+
+@pytest.fixture
+def cache() -> ResponseCache:
+    return ResponseCache("test", MemoryCacheBackend(maxsize=100, ttl=60), ttl=60)
+
+
+@pytest.fixture
+async def cached_items(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[None]:
+    """Turn the item cache on, with a fresh backend, for one test."""
+    monkeypatch.setattr(
+        item_response_cache, "backend", MemoryCacheBackend(maxsize=100, ttl=60))
+    yield
+
+
+async def test_late_fill_is_not_served_after_invalidation(cache: ResponseCache) -> None:
+    object_id = uuid.uuid4()
+    # A miss computes its key, then a write lands before the miss stores
+    stale_key = await cache.detail_key(object_id)
+    await cache.invalidate(object_id)
+    await cache.backend.set(stale_key, CachedResponse(body=b"stale"), ttl=60)
+
+    fresh_key = await cache.detail_key(object_id)
+    assert fresh_key != stale_key
+    assert await cache.get(fresh_key, "test") is None
+
+
+async def test_invalidate_keeps_other_details_and_drops_lists(
+    cache: ResponseCache,
+) -> None:
+    changed, untouched = uuid.uuid4(), uuid.uuid4()
+    untouched_key = await cache.detail_key(untouched)
+    changed_key = await cache.detail_key(changed)
+    list_key = await cache.list_key({"limit": 20})
+
+    await cache.invalidate(changed)
+
+    assert await cache.detail_key(untouched) == untouched_key
+    assert await cache.detail_key(changed) != changed_key
+    assert await cache.list_key({"limit": 20}) != list_key
+
+
+async def test_invalidate_all_drops_every_detail(cache: ResponseCache) -> None:
+    object_id = uuid.uuid4()
+    key = await cache.detail_key(object_id)
+
+    await cache.invalidate_all()
+
+    assert await cache.detail_key(object_id) != key
+
+
+async def test_item_update_replaces_cached_detail_and_list(
+    client: httpx.AsyncClient, owners: List[User], cached_items: None
+) -> None:
+    owner = owners[0]
+    params = {"min_price": PRICE, "max_price": PRICE}
+    items = (await client.get("/api/v1/items/", params=params)).json()
+    item = next(entry for entry in items if entry["owner_id"] == str(owner.id))
+    detail = f"/api/v1/items/{item['id']}"
+
+    assert (await client.get(detail)).headers["x-cache"] == "MISS"
+    assert (await client.get(detail)).headers["x-cache"] == "HIT"
+    assert (await client.get("/api/v1/items/", params=params)).headers[
+        "x-cache"] == "HIT"
+
+    response = await client.patch(
+        detail, json={"title": "Renamed"}, headers=auth_headers(owner))
+    assert response.status_code == 200
+
+    response = await client.get(detail)
+    assert response.headers["x-cache"] == "MISS"
+    assert response.json()["title"] == "Renamed"
+    listing = await client.get("/api/v1/items/", params=params)
+    assert listing.headers["x-cache"] == "MISS"
+    assert "Renamed" in [entry["title"] for entry in listing.json()]
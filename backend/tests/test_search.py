@@ -0,0 +1,38 @@
+"""Behaviour tests for item search on the listing endpoint."""
+import uuid
+
+import httpx
+
+from tests.conftest import MakeUser, auth_headers
+
+
+async def test_search_without_words_matches_nothing(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    await make_user(items=1)
+
+    response = await client.get("/api/v1/items/", params={"search": "!!!"})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+async def test_relevance_ranks_title_matches_first(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    headers = auth_headers(await make_user())
+    word = f"zq{uuid.uuid4().hex[:12]}"
+    created = {}
+    for name, body in (
+        ("description", {"title": "Plain", "description": f"about {word}"}),
+        ("title", {"title": f"{word} lamp"}),
+    ):
+        response = await client.post(
+            "/api/v1/items/", json={**body, "price": 1}, headers=headers)
+        created[name] = response.json()["id"]
+
+    response = await client.get(
+        "/api/v1/items/", params={"search": word, "sort": "relevance"})
+
+    assert [item["id"] for item in response.json()] == [
+        created["title"], created["description"]]
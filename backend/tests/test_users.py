@@ -0,0 +1,42 @@
+"""Behaviour tests for the user endpoints."""
+import httpx
+
+from tests.conftest import MakeUser, auth_headers
+
+
+async def test_update_user_with_null_password_updates_other_fields(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    user = await make_user(full_name="Before")
+
+    response = await client.patch(
+        f"/api/v1/users/{user.id}", json={"full_name": "After", "password": None},
+        headers=auth_headers(user))
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "After"
+
+
+async def test_update_user_with_only_null_password_is_a_no_op(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    user = await make_user(full_name="Unchanged")
+
+    response = await client.patch(
+        f"/api/v1/users/{user.id}", json={"password": None},
+        headers=auth_headers(user))
+
+    assert response.status_code == 200
+    assert response.json()["full_name"] == "Unchanged"
+
+
+async def test_update_user_rejects_empty_password(
+    client: httpx.AsyncClient, make_user: MakeUser
+) -> None:
+    user = await make_user()
+
+    response = await client.patch(
+        f"/api/v1/users/{user.id}", json={"password": ""},
+        headers=auth_headers(user))
+
+    assert response.status_code == 422